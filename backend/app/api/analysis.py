@@ -4,6 +4,7 @@ Endpoints for AI-powered incident analysis
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Depends
+from fastapi.concurrency import run_in_threadpool
 from typing import Dict, Tuple
 from datetime import datetime, timedelta
 from slowapi import Limiter
@@ -93,7 +94,7 @@ async def analyze_incident(
             incident = webhook_incident_data_dict[incident_id]
         else:
             # Fall back to file-based incidents
-            incident = data_loader.load_incident(incident_id)
+            incident = await run_in_threadpool(data_loader.load_incident, incident_id)
 
         # Set max_logs from request or default
         max_logs = analysis_request.max_logs if analysis_request else 1000
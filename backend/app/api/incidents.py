@@ -4,9 +4,12 @@ Endpoints for incident data access
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from typing import List
 
-from app.models.incident import Incident, IncidentListItem
+from app.models.incident import Incident, IncidentListItem, LogEntry, MetricPoint
 from app.core.data_loader import DataLoader
 from app.auth.dependencies import get_current_user_dependency, get_optional_user
 
@@ -15,26 +18,41 @@ router = APIRouter(prefix="/incidents", tags=["incidents"])
 # Initialize data loader
 data_loader = DataLoader()
 
+# Serialize large log/metric lists straight to JSON bytes in pydantic-core,
+# skipping FastAPI's per-object jsonable_encoder pass
+_LOGS_ADAPTER = TypeAdapter(List[LogEntry])
+_METRICS_ADAPTER = TypeAdapter(List[MetricPoint])
+
+
+def _json_response(body: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a response"""
+    return Response(content=body, media_type="application/json")
+
 
 def get_webhook_incidents():
     """Import webhook incidents storage (avoid circular import)"""
     from app.api.webhooks import webhook_incidents, webhook_incident_data
     return webhook_incidents, webhook_incident_data
 
+def _load_file_summaries() -> list:
+    """Load summaries of all file-based incidents, skipping unreadable ones"""
+    summaries = []
+    for incident_id in data_loader.list_incidents():
+        try:
+            summaries.append(data_loader.load_incident(incident_id).summary)
+        except Exception:
+            continue
+    return summaries
+
+
 @router.get("/")
 async def list_incidents(current_user: dict = Depends(get_optional_user)):
     """List all available incidents with summaries (both file-based and webhook-ingested)"""
     try:
         incidents = []
 
-        # Get file-based incidents
-        incident_ids = data_loader.list_incidents()
-        for incident_id in incident_ids:
-            try:
-                incident = data_loader.load_incident(incident_id)
-                incidents.append(incident.summary)
-            except Exception as e:
-                continue
+        # Get file-based incidents (disk reads + validation, off the event loop)
+        incidents.extend(await run_in_threadpool(_load_file_summaries))
 
         # Get webhook-ingested incidents
         webhook_incidents_dict, _ = get_webhook_incidents()
@@ -72,7 +90,7 @@ async def get_incident(
             incident = webhook_incident_data[incident_id]
         else:
             # Fall back to file-based incidents
-            incident = data_loader.load_incident(incident_id)
+            incident = await run_in_threadpool(data_loader.load_incident, incident_id)
 
         # Optionally filter data
         if not include_logs:
@@ -83,7 +101,7 @@ async def get_incident(
         if not include_metrics:
             incident.metrics = []
 
-        return incident
+        return _json_response(incident.model_dump_json())
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -110,7 +128,7 @@ async def get_incident_summary(
         if incident_id in webhook_incident_data:
             incident = webhook_incident_data[incident_id]
         else:
-            incident = data_loader.load_incident(incident_id)
+            incident = await run_in_threadpool(data_loader.load_incident, incident_id)
 
         return incident.summary
 
@@ -143,7 +161,7 @@ async def get_incident_logs(
         if incident_id in webhook_incident_data:
             incident = webhook_incident_data[incident_id]
         else:
-            incident = data_loader.load_incident(incident_id)
+            incident = await run_in_threadpool(data_loader.load_incident, incident_id)
 
         logs = incident.logs
 
@@ -154,7 +172,7 @@ async def get_incident_logs(
         # Apply limit
         logs = logs[:limit]
 
-        return logs
+        return _json_response(_LOGS_ADAPTER.dump_json(logs))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -183,11 +201,11 @@ async def get_incident_metrics(
         if incident_id in webhook_incident_data:
             incident = webhook_incident_data[incident_id]
         else:
-            incident = data_loader.load_incident(incident_id)
+            incident = await run_in_threadpool(data_loader.load_incident, incident_id)
 
         metrics = incident.metrics[:limit]
 
-        return metrics
+        return _json_response(_METRICS_ADAPTER.dump_json(metrics))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -214,7 +232,7 @@ async def get_incident_timeline(
         if incident_id in webhook_incident_data:
             incident = webhook_incident_data[incident_id]
         else:
-            incident = data_loader.load_incident(incident_id)
+            incident = await run_in_threadpool(data_loader.load_incident, incident_id)
 
         return incident.timeline
 
@@ -241,17 +259,12 @@ async def get_recent_incidents(
         incidents_with_time = []
 
         # Get file-based incidents
-        incident_ids = data_loader.list_incidents()
-        for incident_id in incident_ids:
-            try:
-                incident = data_loader.load_incident(incident_id)
-                incidents_with_time.append({
-                    "summary": incident.summary,
-                    "created_at": incident.summary.start_time or incident.summary.detection_time or "",
-                    "source": "manual"
-                })
-            except Exception:
-                continue
+        for summary in await run_in_threadpool(_load_file_summaries):
+            incidents_with_time.append({
+                "summary": summary,
+                "created_at": summary.start_time or summary.detection_time or "",
+                "source": "manual"
+            })
 
         # Get webhook-ingested incidents
         webhook_incidents_dict, _ = get_webhook_incidents()
@@ -168,7 +168,7 @@ async def get_anomalies():
 
         return {
             "total_count": len(all_anomalies),
-            "anomalies": [a.dict() for a in all_anomalies],
+            "anomalies": [a.model_dump() for a in all_anomalies],
             "by_severity": {k: len(v) for k, v in by_severity.items()},
             "detected_at": all_anomalies[0].detected_at if all_anomalies else None
         }
@@ -244,7 +244,7 @@ async def get_recommendations(data_loader: DataLoader = Depends(get_data_loader)
 
         return {
             "total_count": len(recommendations),
-            "recommendations": [r.dict() for r in recommendations],
+            "recommendations": [r.model_dump() for r in recommendations],
             "by_priority": {k: len(v) for k, v in by_priority.items()},
             "generated_at": forecast.generated_at
         }
@@ -6,7 +6,6 @@ Endpoints for voice-based interaction with WardenXT
 from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Request, Depends
 from fastapi.responses import Response
 from typing import Dict, Optional
-import base64
 
 from app.models.voice import (
     VoiceQuery, VoiceResponse, VoiceCapabilitiesResponse,
@@ -122,7 +121,9 @@ async def process_voice_query(
             }
         )
 
-        return VoiceResponse(
+        # audio_base64 can be megabytes: serialize once in pydantic-core
+        # instead of letting FastAPI re-validate the model on the way out
+        voice_response = VoiceResponse(
             transcript=transcript,
             response_text=response_text,
             audio_base64=audio_base64,
@@ -130,6 +131,7 @@ async def process_voice_query(
             incident_ids=incident_ids if incident_ids else None,
             confidence=0.9  # Default high confidence
         )
+        return Response(content=voice_response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -312,6 +314,76 @@ async def execute_voice_command(
         )
 
 
+# The command list is static, so serialize the response once at import
+_CAPABILITIES = [
+    VoiceCapability(
+        command="query_critical",
+        examples=[
+            "What's the most critical incident?",
+            "Show me the worst incident",
+            "What's the highest priority issue?"
+        ],
+        description="Find the most critical incident",
+        parameters=[]
+    ),
+    VoiceCapability(
+        command="query_by_severity",
+        examples=[
+            "Show me P1 incidents",
+            "List all P0 issues",
+            "What are the P2 incidents?"
+        ],
+        description="Filter incidents by severity",
+        parameters=["severity"]
+    ),
+    VoiceCapability(
+        command="analyze_incident",
+        examples=[
+            "Analyze incident 0001",
+            "Run analysis on incident INC-2026-0001",
+            "Investigate incident 0002"
+        ],
+        description="Trigger AI analysis on specific incident",
+        parameters=["incident_id"]
+    ),
+    VoiceCapability(
+        command="summarize_all",
+        examples=[
+            "Summarize all incidents",
+            "Give me an overview",
+            "What's the current status?"
+        ],
+        description="Get summary of all incidents",
+        parameters=[]
+    ),
+    VoiceCapability(
+        command="status_check",
+        examples=[
+            "How many incidents are being investigated?",
+            "What's the current incident count?",
+            "Show me investigating incidents"
+        ],
+        description="Check current incident status",
+        parameters=[]
+    ),
+    VoiceCapability(
+        command="time_based_query",
+        examples=[
+            "What happened today?",
+            "Show me yesterday's incidents",
+            "What happened this week?"
+        ],
+        description="Query incidents by time range",
+        parameters=["time_range"]
+    )
+]
+
+_CAPABILITIES_BODY = VoiceCapabilitiesResponse(
+    capabilities=_CAPABILITIES,
+    total_commands=len(_CAPABILITIES)
+).model_dump_json().encode()
+
+
 @router.get("/capabilities", response_model=VoiceCapabilitiesResponse)
 async def get_voice_capabilities():
     """Get list of available voice commands
@@ -319,73 +391,7 @@ async def get_voice_capabilities():
     Returns:
         List of voice capabilities
     """
-    capabilities = [
-        VoiceCapability(
-            command="query_critical",
-            examples=[
-                "What's the most critical incident?",
-                "Show me the worst incident",
-                "What's the highest priority issue?"
-            ],
-            description="Find the most critical incident",
-            parameters=[]
-        ),
-        VoiceCapability(
-            command="query_by_severity",
-            examples=[
-                "Show me P1 incidents",
-                "List all P0 issues",
-                "What are the P2 incidents?"
-            ],
-            description="Filter incidents by severity",
-            parameters=["severity"]
-        ),
-        VoiceCapability(
-            command="analyze_incident",
-            examples=[
-                "Analyze incident 0001",
-                "Run analysis on incident INC-2026-0001",
-                "Investigate incident 0002"
-            ],
-            description="Trigger AI analysis on specific incident",
-            parameters=["incident_id"]
-        ),
-        VoiceCapability(
-            command="summarize_all",
-            examples=[
-                "Summarize all incidents",
-                "Give me an overview",
-                "What's the current status?"
-            ],
-            description="Get summary of all incidents",
-            parameters=[]
-        ),
-        VoiceCapability(
-            command="status_check",
-            examples=[
-                "How many incidents are being investigated?",
-                "What's the current incident count?",
-                "Show me investigating incidents"
-            ],
-            description="Check current incident status",
-            parameters=[]
-        ),
-        VoiceCapability(
-            command="time_based_query",
-            examples=[
-                "What happened today?",
-                "Show me yesterday's incidents",
-                "What happened this week?"
-            ],
-            description="Query incidents by time range",
-            parameters=["time_range"]
-        )
-    ]
-
-    return VoiceCapabilitiesResponse(
-        capabilities=capabilities,
-        total_commands=len(capabilities)
-    )
+    return Response(content=_CAPABILITIES_BODY, media_type="application/json")
 
 
 @router.get("/health")
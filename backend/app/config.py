@@ -3,15 +3,22 @@ WardenXT Configuration Module
 Centralized configuration management using Pydantic Settings
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
+from functools import cached_property
 from typing import List
 import os
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
-    
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+    )
+
     # Gemini API Configuration
     gemini_api_key: str = Field(..., env="GEMINI_API_KEY")
     gemini_model: str = Field(
@@ -52,6 +59,13 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
     rate_limit_per_minute: int = Field(default=60, env="RATE_LIMIT_PER_MINUTE")
+    rate_limit_storage_uri: str = Field(default="memory://", env="RATE_LIMIT_STORAGE_URI")
+
+    # Worker threads for sync handlers and run_in_threadpool calls
+    threadpool_size: int = Field(
+        default_factory=lambda: min(256, (os.cpu_count() or 1) * 32),
+        env="THREADPOOL_SIZE"
+    )
     
     # CORS Settings - simplified for .env parsing
     cors_origins: str = Field(
@@ -59,9 +73,9 @@ class Settings(BaseSettings):
         env="CORS_ORIGINS"
     )
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from JSON string or comma-separated list"""
+        """Parse CORS origins from JSON string or comma-separated list (once)"""
         import json
         
         if not isinstance(self.cors_origins, str):
@@ -97,11 +111,6 @@ class Settings(BaseSettings):
     enable_visual_debug: bool = Field(default=True, env="ENABLE_VISUAL_DEBUG")
     enable_agentic_actions: bool = Field(default=True, env="ENABLE_AGENTIC_ACTIONS")
     enable_change_sentinel: bool = Field(default=False, env="ENABLE_CHANGE_SENTINEL")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
 
 
 # Global settings instance
@@ -6,6 +6,7 @@ Orchestrates AI-powered incident analysis using Gemini 3
 import json
 from typing import Dict, List, Optional
 from datetime import datetime
+from starlette.concurrency import run_in_threadpool
 
 from app.core.logging import get_logger
 
@@ -58,7 +59,7 @@ class IncidentAnalyzer:
         await self._emit_status_update(incident.summary.incident_id, "Loading incident data...")
         
         # Prepare data for Gemini
-        summary_dict = incident.summary.model_dump()
+        summary_dict = incident.summary.model_dump(mode="json")
         await self._emit_status_update(incident.summary.incident_id, f"Preparing data for analysis...")
         
         # Sample logs intelligently (prioritize errors)
@@ -94,7 +95,9 @@ class IncidentAnalyzer:
         )
         
         try:
-            brief_text = self.gemini.generate_incident_brief(
+            # Blocking SDK call - keep it off the event loop
+            brief_text = await run_in_threadpool(
+                self.gemini.generate_incident_brief,
                 incident_summary=summary_dict,
                 logs_sample=logs_dict,
                 metrics_sample=metrics_dict,
@@ -180,7 +183,7 @@ class IncidentAnalyzer:
         remaining = max_logs - len(sampled)
         sampled.extend(info_logs[:remaining // 2])
         
-        return [log.model_dump() for log in sampled[:max_logs]]
+        return [log.model_dump(mode="json") for log in sampled[:max_logs]]
     
     def _prepare_metrics(self, metrics: List[MetricPoint]) -> List[Dict]:
         """Prepare metrics for analysis
@@ -196,13 +199,13 @@ class IncidentAnalyzer:
         
         if total <= 50:
             # Include all if small dataset
-            return [m.model_dump() for m in metrics]
+            return [m.model_dump(mode="json") for m in metrics]
         
         # Sample ~50 points evenly distributed
         step = total // 50
         sampled = [metrics[i] for i in range(0, total, step)]
         
-        return [m.model_dump() for m in sampled]
+        return [m.model_dump(mode="json") for m in sampled]
     
     def _parse_brief_response(self, response_text: str, incident_id: str) -> IncidentBrief:
         """Parse Gemini response into IncidentBrief
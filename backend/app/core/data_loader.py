@@ -3,11 +3,14 @@ Data Loader
 Loads generated incident data from disk
 """
 
-import json
+import gzip
 import os
 from pathlib import Path
 from typing import Optional, List, Dict
 
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
 from app.core.logging import get_logger
 from app.db.status_store import get_status_store
 
@@ -16,6 +19,10 @@ from app.models.incident import (
     TimelineEvent, RootCause, IncidentStatus, Severity
 )
 
+# Validate whole files in one call instead of one model at a time
+_LOG_ENTRIES = TypeAdapter(List[LogEntry])
+_METRIC_POINTS = TypeAdapter(List[MetricPoint])
+
 
 class DataLoader:
     """Loads incident data from generated datasets"""
@@ -191,8 +198,8 @@ class DataLoader:
         """
         summary_file = incident_dir / "summary.json"
         
-        with open(summary_file, 'r') as f:
-            data = json.load(f)
+        # Read bytes so UTF-8 text decodes the same under any locale
+        data = orjson.loads(summary_file.read_bytes())
         
         # Parse root cause
         root_cause_data = data.get('root_cause', {})
@@ -239,24 +246,13 @@ class DataLoader:
         Returns:
             List of LogEntry objects
         """
-        logs_file = incident_dir / "logs.jsonl"
-        logs = []
-        
-        if not logs_file.exists():
-            self.logger.warning("logs_file_not_found", extra_fields={"path": str(logs_file)})
-            return logs
-        
-        with open(logs_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        data = json.loads(line)
-                        logs.append(LogEntry(**data))
-                    except Exception as e:
-                        self.logger.warning("log_parse_error", extra_fields={"error": str(e), "line": line[:100]})
-                        continue
-        
-        return logs
+        logs_file = self._jsonl_file(incident_dir / "logs.jsonl")
+
+        if logs_file is None:
+            self.logger.warning("logs_file_not_found", extra_fields={"path": str(incident_dir / "logs.jsonl")})
+            return []
+
+        return self._load_jsonl(logs_file, LogEntry, _LOG_ENTRIES, "log_parse_error")
     
     def _load_metrics(self, incident_dir: Path) -> List[MetricPoint]:
         """Load metric points
@@ -267,24 +263,62 @@ class DataLoader:
         Returns:
             List of MetricPoint objects
         """
-        metrics_file = incident_dir / "metrics.jsonl"
-        metrics = []
-        
-        if not metrics_file.exists():
-            self.logger.warning("metrics_file_not_found", extra_fields={"path": str(metrics_file)})
-            return metrics
-        
-        with open(metrics_file, 'r') as f:
+        metrics_file = self._jsonl_file(incident_dir / "metrics.jsonl")
+
+        if metrics_file is None:
+            self.logger.warning("metrics_file_not_found", extra_fields={"path": str(incident_dir / "metrics.jsonl")})
+            return []
+
+        return self._load_jsonl(metrics_file, MetricPoint, _METRIC_POINTS, "metric_parse_error")
+
+    @staticmethod
+    def _jsonl_file(path: Path) -> Optional[Path]:
+        """Return path, or its gzip-compressed .jsonl.gz sibling, if either exists"""
+        if path.exists():
+            return path
+        compressed = path.with_suffix(".jsonl.gz")
+        return compressed if compressed.exists() else None
+
+    def _load_jsonl(self, path: Path, model: type, adapter: TypeAdapter, error_event: str) -> list:
+        """Load and validate a JSONL file, skipping lines that fail to parse
+
+        Args:
+            path: Path to JSONL file
+            model: Model class for a single line
+            adapter: TypeAdapter for a list of ``model``
+            error_event: Log event name for unparseable lines
+
+        Returns:
+            List of validated model objects
+        """
+        # Binary mode: orjson decodes UTF-8 itself, and .gz files (written
+        # by the generator's compress option) are read transparently
+        opener = gzip.open if path.suffix == ".gz" else open
+        rows = []
+        with opener(path, 'rb') as f:
             for line in f:
                 if line.strip():
                     try:
-                        data = json.loads(line)
-                        metrics.append(MetricPoint(**data))
+                        rows.append(orjson.loads(line))
                     except Exception as e:
-                        self.logger.warning("metric_parse_error", extra_fields={"error": str(e), "line": line[:100]})
-                        continue
-        
-        return metrics
+                        self.logger.warning(
+                            error_event,
+                            extra_fields={"error": str(e), "line": line[:100].decode("utf-8", "replace")}
+                        )
+
+        try:
+            return adapter.validate_python(rows)
+        except ValidationError:
+            pass
+
+        # Fall back to row-by-row validation so one bad line doesn't drop the file
+        items = []
+        for row in rows:
+            try:
+                items.append(model.model_validate(row))
+            except ValidationError as e:
+                self.logger.warning(error_event, extra_fields={"error": str(e), "line": str(row)[:100]})
+        return items
     
     def _load_timeline(self, incident_dir: Path) -> List[TimelineEvent]:
         """Load timeline events
@@ -304,7 +338,6 @@ class DataLoader:
             )
             return []
         
-        with open(timeline_file, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(timeline_file.read_bytes())
         
         return [TimelineEvent(**event) for event in data]
\ No newline at end of file
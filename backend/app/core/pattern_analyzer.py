@@ -80,7 +80,7 @@ def analyze_incident_patterns(incidents: List[Incident]) -> Dict[str, Any]:
     thresholds = analyze_metric_threshold_patterns(incidents)
 
     return {
-        "patterns": [p.dict() for p in patterns],
+        "patterns": [p.model_dump() for p in patterns],
         "temporal_analysis": temporal,
         "service_correlations": correlations,
         "metric_thresholds": thresholds,
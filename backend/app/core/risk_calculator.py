@@ -426,7 +426,7 @@ def get_risk_history(hours: int = 24) -> List[Dict[str, Any]]:
     points_needed = hours * 12  # 5-minute intervals
     history = risk_history[-points_needed:] if risk_history else []
 
-    return [p.dict() for p in history]
+    return [p.model_dump() for p in history]
 
 
 def calculate_service_risk(
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
 from app.models.voice import VoiceCommand
+from app.models.incident import ACTIVE_STATUSES, RESOLVED_STATUSES
 from app.core.gemini_audio import get_gemini_audio
 from app.core.logging import get_logger
 from app.core.data_loader import DataLoader
@@ -265,8 +266,8 @@ class VoiceCommandExecutor:
             p1_count = len([i for i in incidents if i.severity == "P1"])
             p2_count = len([i for i in incidents if i.severity == "P2"])
 
-            investigating = len([i for i in incidents if i.status in ["DETECTED", "INVESTIGATING"]])
-            resolved = len([i for i in incidents if i.status in ["RESOLVED", "CLOSED"]])
+            investigating = len([i for i in incidents if i.status in ACTIVE_STATUSES])
+            resolved = len([i for i in incidents if i.status in RESOLVED_STATUSES])
 
             response = (
                 f"You have {total} total incidents. "
@@ -325,7 +326,7 @@ class VoiceCommandExecutor:
                 except Exception:
                     continue
 
-            investigating = [i for i in incidents if i.status in ["DETECTED", "INVESTIGATING"]]
+            investigating = [i for i in incidents if i.status in ACTIVE_STATUSES]
 
             count = len(investigating)
             p0 = len([i for i in investigating if i.severity == "P0"])
@@ -8,7 +8,7 @@ import json
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.core.logging import get_logger
 
@@ -131,7 +131,7 @@ class StatusStore:
         
         # Create new update
         update = StatusUpdate(
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=datetime.now(timezone.utc),
             from_status=from_status,
             to_status=to_status,
             updated_by=updated_by,
@@ -139,13 +139,8 @@ class StatusStore:
         )
         
         # Add to history
-        history.append({
-            'timestamp': update.timestamp,
-            'from_status': update.from_status.value,
-            'to_status': update.to_status.value,
-            'updated_by': update.updated_by,
-            'notes': update.notes
-        })
+        entry = update.model_dump(mode="json")
+        history.append(entry)
         
         # Save to file
         try:
@@ -153,7 +148,7 @@ class StatusStore:
                 json.dump({
                     'incident_id': incident_id,
                     'history': history,
-                    'last_updated': update.timestamp
+                    'last_updated': entry['timestamp']
                 }, f, indent=2)
             
             # Update cache
@@ -6,13 +6,15 @@ Main application entry point
 
 import json
 import time
+import anyio
+import orjson
 import psutil
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI
+from fastapi.responses import Response
+from starlette.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -23,11 +25,19 @@ from app.config import settings, validate_security_settings
 # Track application start time for uptime calculation
 APP_START_TIME = time.time()
 from app.api import incidents, analysis, status, auth, webhooks, voice, runbooks, predictions
-from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler, RateLimitMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.middleware.cors import CORSMiddleware
+from app.middleware.error_handler import GlobalErrorMiddleware
+from app.utils.responses import ORJSONResponse
 from app.core.logging import setup_logging, get_logger
 from app.db.database import init_db
 
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # Optional: falls back to gzip-only compression
+    BrotliMiddleware = None
+
 # Setup logging
 logger = setup_logging()
 logger.info("application_started", extra_fields={"environment": settings.app_env}) 
@@ -38,16 +48,34 @@ app = FastAPI(
     description="AI-Powered Incident Commander - Gemini 3 Hackathon Project",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Initialize rate limiter
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
-# Security headers middleware (add first)
+# Unhandled exceptions -> JSON 500 (innermost, so error responses still
+# get security and CORS headers)
+app.add_middleware(GlobalErrorMiddleware, debug=settings.app_debug)
+
+# Security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Response compression (brotli when available, gzip otherwise).
+# The SSE agent stream is excluded so events aren't buffered.
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=4,
+        minimum_size=1024,
+        gzip_fallback=True,
+        excluded_handlers=[r"/agent/stream$"],
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -57,6 +85,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Global per-IP rate limit. Added last so it is the outermost layer and
+# rejected requests skip CORS, compression and security headers entirely.
+if settings.rate_limit_enabled:
+    app.add_middleware(
+        RateLimitMiddleware,
+        per_minute=settings.rate_limit_per_minute,
+        storage_uri=settings.rate_limit_storage_uri,
+    )
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
@@ -66,6 +103,10 @@ async def startup_event():
         validate_security_settings()
         logger.info("security_settings_validated")
 
+        # Size the threadpool used for blocking work (default is 40)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+        logger.info("threadpool_configured", extra_fields={"size": settings.threadpool_size})
+
         # Initialize database
         init_db()
         logger.info("database_initialized")
@@ -89,32 +130,36 @@ app.include_router(predictions.router, prefix="/api")
 
 
 
+# The root payload never changes, so serialize it once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "WardenXT API - AI-Powered Incident Commander",
+    "version": "1.0.0",
+    "description": "From reactive firefighting to proactive prevention using Google Gemini 3",
+    "powered_by": "Google Gemini 3 Flash",
+    "docs": "/docs",
+    "health": "/health",
+    "features": {
+        "ai_analysis": "Analyze thousands of logs in seconds",
+        "voice_commander": "Natural language incident queries",
+        "auto_runbooks": "Generate executable remediation scripts",
+        "predictive_analytics": "Forecast incidents before they occur",
+        "real_time_ingestion": "Webhook integration with monitoring tools"
+    },
+    "endpoints": {
+        "incidents": "/api/incidents",
+        "analysis": "/api/analysis",
+        "predictions": "/api/predictions",
+        "voice": "/api/voice",
+        "runbooks": "/api/runbooks",
+        "webhooks": "/api/webhooks"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API welcome and info"""
-    return {
-        "message": "WardenXT API - AI-Powered Incident Commander",
-        "version": "1.0.0",
-        "description": "From reactive firefighting to proactive prevention using Google Gemini 3",
-        "powered_by": "Google Gemini 3 Flash",
-        "docs": "/docs",
-        "health": "/health",
-        "features": {
-            "ai_analysis": "Analyze thousands of logs in seconds",
-            "voice_commander": "Natural language incident queries",
-            "auto_runbooks": "Generate executable remediation scripts",
-            "predictive_analytics": "Forecast incidents before they occur",
-            "real_time_ingestion": "Webhook integration with monitoring tools"
-        },
-        "endpoints": {
-            "incidents": "/api/incidents",
-            "analysis": "/api/analysis",
-            "predictions": "/api/predictions",
-            "voice": "/api/voice",
-            "runbooks": "/api/runbooks",
-            "webhooks": "/api/webhooks"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 def get_uptime() -> str:
@@ -149,6 +194,20 @@ def get_memory_usage() -> dict:
         return {"error": "Unable to retrieve memory info"}
 
 
+# Parts of the health payload that only depend on settings loaded at import
+_APP_ENV = settings.app_env
+_GEMINI_STATUS = "configured" if settings.gemini_api_key else "not_configured"
+_HEALTH_CONFIG = {
+    "gemini_model": settings.gemini_model,
+    "features": {
+        "total_recall": settings.enable_total_recall,
+        "visual_debug": settings.enable_visual_debug,
+        "agentic_actions": settings.enable_agentic_actions,
+        "change_sentinel": settings.enable_change_sentinel
+    }
+}
+
+
 @app.get("/health")
 async def health_check():
     """Comprehensive health check endpoint for monitoring"""
@@ -163,68 +222,41 @@ async def health_check():
         db_status = f"unhealthy: {str(e)}"
         logger.error("health_check_db_failed", extra_fields={"error": str(e)})
 
-    # Check Gemini API (basic check - just verify config exists)
-    gemini_status = "configured" if settings.gemini_api_key else "not_configured"
-
-    # Overall status
-    is_healthy = db_status == "healthy" and gemini_status == "configured"
+    # Overall status (Gemini check just verifies config exists)
+    is_healthy = db_status == "healthy" and _GEMINI_STATUS == "configured"
 
-    return {
+    body = orjson.dumps({
         "status": "healthy" if is_healthy else "degraded",
         "timestamp": datetime.utcnow().isoformat(),
         "version": "1.0.0",
-        "environment": settings.app_env,
+        "environment": _APP_ENV,
         "uptime": get_uptime(),
         "memory": get_memory_usage(),
         "services": {
             "database": db_status,
-            "gemini_api": gemini_status,
+            "gemini_api": _GEMINI_STATUS,
             "webhooks": "active",
             "predictions": "running",
             "voice": "active",
             "runbooks": "active"
         },
-        "config": {
-            "gemini_model": settings.gemini_model,
-            "features": {
-                "total_recall": settings.enable_total_recall,
-                "visual_debug": settings.enable_visual_debug,
-                "agentic_actions": settings.enable_agentic_actions,
-                "change_sentinel": settings.enable_change_sentinel
-            }
-        }
-    }
-
-
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler with logging"""
-    logger.error(
-        "unhandled_exception",
-        extra_fields={
-            "path": request.url.path,
-            "method": request.method,
-            "error": str(exc),
-            "error_type": type(exc).__name__
-        },
-        exc_info=True
-    )
-    
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Internal server error",
-            "detail": str(exc) if settings.app_debug else "An error occurred"
-        }
-    )
+        "config": _HEALTH_CONFIG
+    })
+    return Response(content=body, media_type="application/json")
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    
+
+    # Request the C-backed event loop and HTTP parser explicitly so a broken
+    # install fails loudly instead of silently falling back (uvloop has no
+    # Windows build)
     uvicorn.run(
         "app.main:app",
         host=settings.app_host,
         port=settings.app_port,
-        reload=settings.app_debug
+        reload=settings.app_debug,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
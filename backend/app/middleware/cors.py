@@ -0,0 +1,22 @@
+"""
+CORS Middleware
+Starlette's CORSMiddleware with set-based origin and method lookups
+"""
+
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+
+
+class CORSMiddleware(StarletteCORSMiddleware):
+    """CORSMiddleware that checks origins and methods against frozensets
+
+    Starlette keeps ``allow_origins`` as the list it was given and scans it
+    on every cross-origin request and preflight. Converting the allowlists
+    once at startup makes those checks O(1). The preflight header values
+    are already precomputed by the parent class.
+    """
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+        self.allow_methods = frozenset(self.allow_methods)
+        self.allow_headers = frozenset(self.allow_headers)
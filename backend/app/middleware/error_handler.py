@@ -0,0 +1,73 @@
+"""
+Error Handling Middleware
+Turns uncaught exceptions into a JSON 500 response
+"""
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_GENERIC_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "detail": "An error occurred"
+})
+
+
+class GlobalErrorMiddleware:
+    """Catches unhandled exceptions, logs them and returns a JSON 500
+
+    The success path is a single await; the error body is only built when
+    an exception actually escapes (and is canned unless debug is on).
+    """
+
+    def __init__(self, app: ASGIApp, debug: bool = False):
+        self.app = app
+        self.debug = debug
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            logger.error(
+                "unhandled_exception",
+                extra_fields={
+                    "path": scope.get("path"),
+                    "method": scope.get("method"),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__
+                },
+                exc_info=True
+            )
+
+            # Too late to replace a response that is already on the wire
+            if response_started:
+                raise
+
+            if self.debug:
+                body = orjson.dumps({"error": "Internal server error", "detail": str(exc)})
+            else:
+                body = _GENERIC_ERROR_BODY
+
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
@@ -3,19 +3,156 @@ Rate Limiting Middleware
 Prevents API abuse and ensures fair resource usage
 """
 
+import itertools
+import math
+import os
+import time
+from collections import OrderedDict
+
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from fastapi import Request, HTTPException, status
+from fastapi import Request, status
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
-# Initialize rate limiter
+# Per-route limiter used by @limiter.limit decorators. The global
+# per-minute limit is enforced by RateLimitMiddleware below.
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=[f"{settings.rate_limit_per_minute}/minute"] if settings.rate_limit_enabled else []
+    storage_uri=settings.rate_limit_storage_uri,
 )
 
+_RATE_LIMITED_BODY = b'{"detail":"Rate limit exceeded"}'
+
+# Health probes from orchestrators are never throttled
+_EXEMPT_PATHS = frozenset({"/health"})
+
+# Rolling-window limiter evaluated atomically on the Redis server:
+# drop entries older than the window, count the rest and record this
+# request only if it is under the limit. Returns {allowed, count}.
+# KEYS[1] = bucket key; ARGV = now_ms, window_ms, limit, member
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, tonumber(ARGV[1]) - tonumber(ARGV[2]))
+local count = redis.call('ZCARD', KEYS[1])
+if count >= tonumber(ARGV[3]) then
+    return {0, count}
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return {1, count + 1}
+"""
+
+
+class RateLimitMiddleware:
+    """Per-IP rate limiter implemented as plain ASGI middleware
+
+    By default each client IP gets an in-process token bucket holding up to
+    ``per_minute`` tokens which refills continuously, so limits apply per
+    worker. When ``storage_uri`` points at Redis, a rolling one-minute
+    window shared by all workers is used instead, costing one round trip
+    per request. Requests over the limit are rejected with 429.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        per_minute: int = 60,
+        max_clients: int = 10000,
+        exempt_paths: frozenset = _EXEMPT_PATHS,
+        storage_uri: str = "memory://",
+    ):
+        self.app = app
+        self.per_minute = per_minute
+        self.capacity = float(per_minute)
+        self.refill_rate = per_minute / 60.0  # tokens per second
+        self.max_clients = max_clients
+        self.exempt_paths = frozenset(exempt_paths)
+        # Least recently seen client first, so eviction is O(1)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+        self._window_script = None
+        if storage_uri.startswith(("redis://", "rediss://")):
+            import redis.asyncio as redis
+
+            client = redis.from_url(storage_uri)
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT
+            self._window_script = client.register_script(_SLIDING_WINDOW_LUA)
+            self._member_prefix = f"{os.getpid()}:{id(self):x}"
+            self._member_seq = itertools.count()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope.get("path", "") in self.exempt_paths:
+            return await self.app(scope, receive, send)
+
+        client = scope.get("client")
+        key = client[0] if client else "127.0.0.1"
+
+        if self._window_script is not None:
+            allowed = await self._consume_shared(key)
+        else:
+            allowed = self._consume(key, time.monotonic())
+
+        if not allowed:
+            return await self._reject(send)
+
+        await self.app(scope, receive, send)
+
+    def _consume(self, key: str, now: float) -> bool:
+        """Take one token from the client's bucket, returning False if empty
+
+        Buckets form a bounded LRU: once more than ``max_clients`` keys are
+        tracked, the least recently seen one is dropped. An evicted client
+        simply starts again with a full bucket.
+        """
+        buckets = self._buckets
+        bucket = buckets.get(key)
+        if bucket is None:
+            tokens, last_refill = self.capacity, now
+        else:
+            buckets.move_to_end(key)
+            tokens, last_refill = bucket
+        tokens = min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
+
+        allowed = tokens >= 1.0
+        buckets[key] = (tokens - 1.0 if allowed else tokens, now)
+        if len(buckets) > self.max_clients:
+            buckets.popitem(last=False)
+        return allowed
+
+    async def _consume_shared(self, key: str) -> bool:
+        """Record the request in the client's Redis window, returning False if full"""
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}:{self._member_prefix}:{next(self._member_seq)}"
+        try:
+            allowed, _count = await self._window_script(
+                keys=[f"ratelimit:{key}"],
+                args=[now_ms, 60000, self.per_minute, member],
+            )
+        except Exception as e:
+            # Fail open: an unavailable Redis must not take the API down
+            logger.warning("rate_limit_redis_failed", extra_fields={"error": str(e)})
+            return True
+        return bool(allowed)
+
+    async def _reject(self, send: Send):
+        retry_after = math.ceil(1.0 / self.refill_rate) if self.refill_rate else 60
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_RATE_LIMITED_BODY)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _RATE_LIMITED_BODY})
+
 
 def get_rate_limit_key(request: Request) -> str:
     """Get rate limit key from request
@@ -40,9 +177,14 @@ def get_rate_limit_key(request: Request) -> str:
 
 # Custom rate limit exceeded handler
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
-    """Custom handler for rate limit exceeded"""
-    raise HTTPException(
+    """Custom handler for rate limit exceeded
+
+    Returns the canned 429 directly rather than raising HTTPException, so
+    rejections (the common path under abuse) skip the exception machinery.
+    """
+    return Response(
+        content=_RATE_LIMITED_BODY,
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        detail=f"Rate limit exceeded: {exc.detail}",
-        headers={"Retry-After": str(exc.retry_after) if hasattr(exc, 'retry_after') else "60"}
+        media_type="application/json",
+        headers={"Retry-After": str(getattr(exc, "retry_after", 60))}
     )
@@ -3,42 +3,59 @@ Security Headers Middleware
 Adds security headers to all responses
 """
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Adds security headers to all responses"""
-    
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # CSP: Removed 'unsafe-eval' for better security
-        # Note: 'unsafe-inline' should be replaced with nonces/hashes in production
-        # TODO: Implement CSP nonces for Next.js inline scripts
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' data:; "
-            "connect-src 'self' http://localhost:* https:; "
-            "object-src 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self';"
-        )
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), "
-            "microphone=(), "
-            "camera=()"
-        )
-        
-        return response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# CSP: Removed 'unsafe-eval' for better security
+# Note: 'unsafe-inline' should be replaced with nonces/hashes in production
+# TODO: Implement CSP nonces for Next.js inline scripts
+_CSP = (
+    b"default-src 'self'; "
+    b"script-src 'self' 'unsafe-inline'; "
+    b"style-src 'self' 'unsafe-inline'; "
+    b"img-src 'self' data: https:; "
+    b"font-src 'self' data:; "
+    b"connect-src 'self' http://localhost:* https:; "
+    b"object-src 'none'; "
+    b"base-uri 'self'; "
+    b"form-action 'self';"
+)
+
+# Header values never change, so keep them as pre-encoded bytes
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", _CSP),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+)
+
+# Health probes and API docs skip the middleware entirely
+_BYPASS = frozenset({"/health", "/openapi.json", "/docs", "/redoc"})
+
+
+class SecurityHeadersMiddleware:
+    """Adds security headers to all responses
+
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware so
+    no Request/Response objects or extra tasks are created per request.
+    """
+
+    def __init__(self, app: ASGIApp, bypass_paths: frozenset = _BYPASS):
+        self.app = app
+        self.bypass_paths = frozenset(bypass_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope.get("path", "") in self.bypass_paths:
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # Copy rather than extend in place: the list may belong to a
+                # Response object that is reused across requests
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -3,12 +3,12 @@ Analysis Data Models
 Pydantic models for AI-generated analysis
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional
-from enum import Enum
+from enum import StrEnum
 
 
-class AnalysisStatus(str, Enum):
+class AnalysisStatus(StrEnum):
     """Analysis status"""
     PENDING = "PENDING"
     IN_PROGRESS = "IN_PROGRESS"
@@ -16,7 +16,7 @@ class AnalysisStatus(str, Enum):
     FAILED = "FAILED"
 
 
-class ConfidenceLevel(str, Enum):
+class ConfidenceLevel(StrEnum):
     """Confidence in analysis"""
     LOW = "LOW"          # < 50%
     MEDIUM = "MEDIUM"    # 50-75%
@@ -53,17 +53,8 @@ class ImpactAssessment(BaseModel):
 
 class IncidentBrief(BaseModel):
     """AI-generated incident brief"""
-    incident_id: str
-    executive_summary: str
-    root_cause: RootCauseAnalysis
-    impact: ImpactAssessment
-    recommended_actions: List[MitigationAction]
-    timeline_summary: str
-    generated_at: str
-    analysis_status: AnalysisStatus = AnalysisStatus.COMPLETED
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "incident_id": "INC-2026-0001",
                 "executive_summary": "Database connection pool exhaustion...",
@@ -75,6 +66,16 @@ class IncidentBrief(BaseModel):
                 }
             }
         }
+    )
+
+    incident_id: str
+    executive_summary: str
+    root_cause: RootCauseAnalysis
+    impact: ImpactAssessment
+    recommended_actions: List[MitigationAction]
+    timeline_summary: str
+    generated_at: str
+    analysis_status: AnalysisStatus = AnalysisStatus.COMPLETED
 
 
 class AgentStatus(BaseModel):
@@ -3,13 +3,34 @@ Incident Data Models - Enhanced with Status Tracking
 Pydantic models for incident data structures with lifecycle management
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field, model_serializer
+from typing import Any, List, Dict, Optional
 from datetime import datetime
-from enum import Enum
-
-
-class Severity(str, Enum):
+from enum import StrEnum
+
+__all__ = [
+    "Severity",
+    "IncidentStatus",
+    "ACTIVE_STATUSES",
+    "RESOLVED_STATUSES",
+    "StatusUpdate",
+    "LogMetadata",
+    "LogEntry",
+    "MetricPoint",
+    "TimelineEvent",
+    "RootCause",
+    "IncidentSummary",
+    "Incident",
+    "IncidentListItem",
+    "StatusUpdateRequest",
+    "PagerDutyWebhook",
+    "SlackWebhook",
+    "GenericWebhook",
+    "WebhookSource",
+    "ExternalIncident",
+]
+
+class Severity(StrEnum):
     """Incident severity levels"""
     P0 = "P0"  # Critical - Complete outage
     P1 = "P1"  # High - Major functionality impaired
@@ -17,7 +38,7 @@ class Severity(str, Enum):
     P3 = "P3"  # Low - Minor issues
 
 
-class IncidentStatus(str, Enum):
+class IncidentStatus(StrEnum):
     """Incident lifecycle status"""
     DETECTED = "DETECTED"          # Initial detection
     INVESTIGATING = "INVESTIGATING" # Team investigating
@@ -28,18 +49,38 @@ class IncidentStatus(str, Enum):
     CLOSED = "CLOSED"               # Incident closed
 
 
+# Status groupings for O(1) membership checks
+ACTIVE_STATUSES = frozenset({IncidentStatus.DETECTED, IncidentStatus.INVESTIGATING})
+RESOLVED_STATUSES = frozenset({IncidentStatus.RESOLVED, IncidentStatus.CLOSED})
+
+
 class StatusUpdate(BaseModel):
     """Status update record"""
-    timestamp: str
+    timestamp: datetime
     from_status: IncidentStatus
     to_status: IncidentStatus
     updated_by: str = "System"
     notes: Optional[str] = None
 
 
+class LogMetadata(BaseModel):
+    """Structured metadata attached to a log entry"""
+    model_config = ConfigDict(extra="allow")  # Keep unknown keys from external sources
+
+    error_code: Optional[str] = None
+    retry_count: Optional[int] = None
+    webhook_payload: Optional[dict[str, Any]] = None
+
+    @model_serializer(mode="wrap")
+    def _serialize_set_keys(self, handler):
+        """Dump only the keys the source provided, not unset defaults"""
+        data = handler(self)
+        return {key: value for key, value in data.items() if key in self.model_fields_set}
+
+
 class LogEntry(BaseModel):
     """Single log entry"""
-    timestamp: str
+    timestamp: datetime
     level: str
     service: str
     host: str
@@ -48,20 +89,20 @@ class LogEntry(BaseModel):
     request_id: Optional[str] = None
     user_id: Optional[str] = None
     stack_trace: Optional[str] = None
-    metadata: Optional[Dict] = None
+    metadata: Optional[LogMetadata] = None
 
 
 class MetricPoint(BaseModel):
     """Single metric data point"""
-    timestamp: str
+    timestamp: datetime
     service: str
     host: str
-    metrics: Dict[str, float]
+    metrics: dict[str, float]
 
 
 class TimelineEvent(BaseModel):
     """Incident timeline event"""
-    time: str
+    time: str  # Wall-clock "HH:MM", not a full timestamp
     event: str
     impact: str
     type: str = "incident_event"
@@ -95,7 +136,7 @@ class IncidentSummary(BaseModel):
     resolution_time: Optional[str] = None
     mitigation_steps: List[str]
     lessons_learned: List[str]
-    status_history: List[StatusUpdate] = []
+    status_history: List[StatusUpdate] = Field(default_factory=list)
 
 
 class Incident(BaseModel):
@@ -105,11 +146,6 @@ class Incident(BaseModel):
     metrics: List[MetricPoint]
     timeline: List[TimelineEvent]
     status: IncidentStatus = IncidentStatus.DETECTED
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class IncidentListItem(BaseModel):
@@ -138,7 +174,7 @@ class StatusUpdateRequest(BaseModel):
 class PagerDutyWebhook(BaseModel):
     """PagerDuty incident webhook payload"""
     event_type: str
-    incident: Dict
+    incident: dict[str, Any]
 
 
 class SlackWebhook(BaseModel):
@@ -151,13 +187,12 @@ class SlackWebhook(BaseModel):
 
 class GenericWebhook(BaseModel):
     """Generic webhook that accepts any JSON"""
-    data: Dict = Field(default_factory=dict)
+    model_config = ConfigDict(extra="allow")  # Allow any additional fields
 
-    class Config:
-        extra = "allow"  # Allow any additional fields
+    data: Dict = Field(default_factory=dict)
 
 
-class WebhookSource(str, Enum):
+class WebhookSource(StrEnum):
     """Webhook source type"""
     PAGERDUTY = "pagerduty"
     SLACK = "slack"
@@ -168,7 +203,7 @@ class ExternalIncident(BaseModel):
     """Incident created from external webhook"""
     incident_id: str
     source: WebhookSource
-    raw_payload: Dict
+    raw_payload: dict[str, Any]
     created_at: str
     incident_data: IncidentSummary
     auto_analyzed: bool = False
@@ -3,7 +3,7 @@ Prediction Models
 Data models for predictive analytics and incident forecasting
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -11,7 +11,7 @@ from datetime import datetime
 class IncidentPrediction(BaseModel):
     """Predicted incident with probability and reasoning"""
     prediction_id: str = Field(..., description="Unique prediction identifier")
-    predicted_at: str = Field(..., description="ISO timestamp when prediction was made")
+    predicted_at: datetime = Field(..., description="ISO timestamp when prediction was made")
     time_horizon: str = Field(..., description="Prediction window: 24h, 48h, 72h")
     probability: float = Field(..., ge=0, le=100, description="Probability of incident (0-100)")
     confidence: float = Field(..., ge=0, le=100, description="Confidence in prediction (0-100)")
@@ -24,12 +24,21 @@ class IncidentPrediction(BaseModel):
     reasoning: str = Field(..., description="Gemini's detailed explanation for this prediction")
 
 
+class ContributingFactor(BaseModel):
+    """Single weighted factor in a risk score"""
+    name: str = Field(..., description="Factor name")
+    weight: float = Field(..., description="Weight of this factor in the total score")
+    score: float = Field(..., description="Factor score 0-100")
+    detail: str = Field(default="", description="Explanation of the factor score")
+    weighted_score: float = Field(default=0.0, description="weight * score")
+
+
 class RiskScore(BaseModel):
     """Current system risk assessment"""
     score: int = Field(..., ge=0, le=100, description="Risk score 0-100")
     level: str = Field(..., description="Risk level: low, medium, high, critical")
     calculated_at: str = Field(..., description="ISO timestamp when calculated")
-    contributing_factors: List[Dict[str, Any]] = Field(
+    contributing_factors: List[ContributingFactor] = Field(
         default_factory=list,
         description="Factors increasing risk with weights and scores"
     )
@@ -41,7 +50,7 @@ class RiskScore(BaseModel):
 class Anomaly(BaseModel):
     """Detected system anomaly"""
     anomaly_id: str = Field(..., description="Unique anomaly identifier")
-    detected_at: str = Field(..., description="ISO timestamp when detected")
+    detected_at: datetime = Field(..., description="ISO timestamp when detected")
     metric_name: str = Field(..., description="Name of the anomalous metric")
     metric_type: str = Field(default="system", description="Type: cpu, memory, network, error, latency")
     current_value: float = Field(..., description="Current metric value")
@@ -114,7 +123,7 @@ class HistoricalPattern(BaseModel):
 
 class RiskTrendPoint(BaseModel):
     """Single point in risk trend history"""
-    timestamp: str = Field(..., description="ISO timestamp")
+    timestamp: datetime = Field(..., description="ISO timestamp")
     score: int = Field(..., ge=0, le=100, description="Risk score at this time")
     level: str = Field(..., description="Risk level at this time")
     incident_occurred: bool = Field(default=False, description="Whether incident occurred at this time")
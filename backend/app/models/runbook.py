@@ -49,7 +49,7 @@ class ExecutionResult(BaseModel):
     success: bool = Field(..., description="Whether execution succeeded")
     output: str = Field(default="", description="Standard output from command")
     error: Optional[str] = Field(None, description="Error message if failed")
-    executed_at: str = Field(..., description="ISO timestamp when executed")
+    executed_at: datetime = Field(..., description="ISO timestamp when executed")
     executed_by: str = Field(default="system", description="User or system that executed")
     dry_run: bool = Field(default=True, description="Whether this was a dry-run (no actual execution)")
     duration_seconds: float = Field(default=0.0, description="How long execution took")
@@ -5,10 +5,10 @@ Pydantic models for voice query and response handling
 
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
-from enum import Enum
+from enum import StrEnum
 
 
-class QueryType(str, Enum):
+class QueryType(StrEnum):
     """Type of voice query"""
     QUESTION = "question"  # User asking a question
     COMMAND = "command"    # User giving a command
@@ -53,7 +53,7 @@ class VoiceCapabilitiesResponse(BaseModel):
     total_commands: int
 
 
-class AudioFormat(str, Enum):
+class AudioFormat(StrEnum):
     """Supported audio formats"""
     WAV = "audio/wav"
     MP3 = "audio/mp3"
@@ -3,29 +3,61 @@ Audio Utilities
 Helper functions for audio processing and format conversion
 """
 
-import io
-import base64
-from typing import Tuple, Optional
+import logging
+import struct
+from functools import lru_cache
+from typing import Tuple, Optional, Union
 
 from app.core.logging import get_logger
 from app.models.voice import AudioFormat
 
+try:
+    import pybase64
+except ImportError:  # Optional: SIMD base64, falls back to the stdlib codec
+    import base64 as pybase64
+
 logger = get_logger(__name__)
 
 # Maximum audio file size (10MB)
 MAX_AUDIO_SIZE = 10 * 1024 * 1024
 
+# File signatures as big-endian integers, so sniffing the header is one
+# unpack plus integer compares instead of several slice allocations
+_HEADER = struct.Struct('>III')
+_RIFF = int.from_bytes(b'RIFF', 'big')
+_WAVE = int.from_bytes(b'WAVE', 'big')
+_OGGS = int.from_bytes(b'OggS', 'big')
+_EBML = 0x1A45DFA3  # EBML/WebM header
+_ID3 = int.from_bytes(b'ID3', 'big')
+_MPEG_SYNC = 0xFFFB
+
+# Signature -> format, one table per prefix width so a 4-byte magic can
+# never collide with a shorter one. RIFF additionally needs the WAVE tag.
+_MAGIC_4 = {_RIFF: AudioFormat.WAV, _OGGS: AudioFormat.OGG, _EBML: AudioFormat.WEBM}
+_MAGIC_3 = {_ID3: AudioFormat.MP3}
+_MAGIC_2 = {_MPEG_SYNC: AudioFormat.MP3}
+
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+_SUPPORTED_FORMATS = (AudioFormat.WAV, AudioFormat.MP3, AudioFormat.WEBM, AudioFormat.OGG)
+
 
-def validate_audio_size(audio_data: bytes) -> bool:
+def _buffer_size(audio_data) -> int:
+    """Byte length of any buffer-protocol object without copying it"""
+    nbytes = getattr(audio_data, "nbytes", None)
+    return nbytes if nbytes is not None else len(audio_data)
+
+
+def validate_audio_size(audio_data) -> bool:
     """Validate audio file size
 
     Args:
-        audio_data: Audio file bytes
+        audio_data: Audio file bytes or any bytes-like buffer
 
     Returns:
         True if valid size, False otherwise
     """
-    size = len(audio_data)
+    size = _buffer_size(audio_data)
     if size > MAX_AUDIO_SIZE:
         logger.warning(
             "audio_size_exceeded",
@@ -35,6 +67,16 @@ def validate_audio_size(audio_data: bytes) -> bool:
     return True
 
 
+@lru_cache(maxsize=1024)
+def _detect_from_prefix(prefix: bytes) -> Optional[str]:
+    """Match a 12-byte header prefix against known signatures (memoized)"""
+    w0, _, w2 = _HEADER.unpack_from(prefix)
+    audio_format = _MAGIC_4.get(w0) or _MAGIC_3.get(w0 >> 8) or _MAGIC_2.get(w0 >> 16)
+    if audio_format is not None and (w0 != _RIFF or w2 == _WAVE):
+        return audio_format
+    return None
+
+
 def detect_audio_format(audio_data: bytes) -> Optional[str]:
     """Detect audio format from file header
 
@@ -47,30 +89,29 @@ def detect_audio_format(audio_data: bytes) -> Optional[str]:
     if not audio_data or len(audio_data) < 12:
         return None
 
-    # Check file signatures
-    if audio_data[:4] == b'RIFF' and audio_data[8:12] == b'WAVE':
-        return AudioFormat.WAV
-    elif audio_data[:3] == b'ID3' or audio_data[:2] == b'\xff\xfb':
-        return AudioFormat.MP3
-    elif audio_data[:4] == b'OggS':
-        return AudioFormat.OGG
-    elif audio_data[:4] == b'\x1a\x45\xdf\xa3':  # EBML/WebM header
-        return AudioFormat.WEBM
-
-    logger.warning("unknown_audio_format", extra_fields={"header": audio_data[:12].hex()})
+    # Check file signatures; retries of the same capture hit the cache
+    prefix = bytes(audio_data[:12])
+    audio_format = _detect_from_prefix(prefix)
+    if audio_format is not None:
+        return audio_format
+
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning("unknown_audio_format", extra_fields={"header": prefix.hex()})
     return None
 
 
-def convert_to_base64(audio_data: bytes) -> str:
+def convert_to_base64(audio_data: Union[bytes, bytearray, memoryview]) -> str:
     """Convert audio bytes to base64 string
 
     Args:
-        audio_data: Audio file bytes
+        audio_data: Audio file bytes or any bytes-like buffer (not copied)
 
     Returns:
         Base64 encoded string
     """
-    return base64.b64encode(audio_data).decode('utf-8')
+    if not isinstance(audio_data, memoryview):
+        audio_data = memoryview(audio_data)
+    return pybase64.b64encode(audio_data).decode('ascii')
 
 
 def convert_from_base64(base64_data: str) -> bytes:
@@ -82,7 +123,7 @@ def convert_from_base64(base64_data: str) -> bytes:
     Returns:
         Audio file bytes
     """
-    return base64.b64decode(base64_data)
+    return pybase64.b64decode(base64_data, validate=False)
 
 
 def prepare_audio_for_gemini(audio_data: bytes, mime_type: Optional[str] = None) -> Tuple[bytes, str]:
@@ -109,9 +150,10 @@ def prepare_audio_for_gemini(audio_data: bytes, mime_type: Optional[str] = None)
             mime_type = AudioFormat.WAV
             logger.warning("defaulting_to_wav_format")
 
+        size = _buffer_size(audio_data)
         logger.info(
             "audio_prepared_for_gemini",
-            extra_fields={"size_bytes": len(audio_data), "mime_type": mime_type}
+            extra_fields={"size_bytes": size, "mime_type": mime_type}
         )
 
         return audio_data, mime_type
@@ -125,13 +167,13 @@ def prepare_audio_for_gemini(audio_data: bytes, mime_type: Optional[str] = None)
         raise
 
 
-def get_supported_formats() -> list:
-    """Get list of supported audio formats
+def get_supported_formats() -> tuple[str, ...]:
+    """Get supported audio formats
 
     Returns:
-        List of supported MIME types
+        Immutable tuple of supported MIME types (shared, built once)
     """
-    return [AudioFormat.WAV, AudioFormat.MP3, AudioFormat.WEBM, AudioFormat.OGG]
+    return _SUPPORTED_FORMATS
 
 
 def format_audio_duration(duration_seconds: float) -> str:
@@ -148,33 +190,35 @@ def format_audio_duration(duration_seconds: float) -> str:
     return f"{minutes}:{seconds:02d}"
 
 
-def create_silence_wav(duration_seconds: float = 0.5) -> bytes:
+@lru_cache(maxsize=16)
+def create_silence_wav(
+    duration_seconds: float = 0.5,
+    sample_rate: int = 16000,
+    num_channels: int = 1,
+    sample_width: int = 2,
+) -> bytes:
     """Create a silent WAV file (useful for testing)
 
+    Output is deterministic, so results are memoized per parameter set.
+
     Args:
         duration_seconds: Duration of silence
+        sample_rate: Samples per second (default 16kHz)
+        num_channels: Channel count (default mono)
+        sample_width: Bytes per sample (default 16-bit)
 
     Returns:
         WAV file bytes
     """
-    import struct
-    import wave
-
-    # 16-bit, 16kHz mono
-    sample_rate = 16000
-    num_channels = 1
-    sample_width = 2  # 16-bit
     num_samples = int(sample_rate * duration_seconds)
-
-    # Create WAV in memory
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        wav_file.setnchannels(num_channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-
-        # Write silence (zeros)
-        silence = struct.pack(f'{num_samples}h', *([0] * num_samples))
-        wav_file.writeframes(silence)
-
-    return wav_buffer.getvalue()
+    block_align = num_channels * sample_width
+    data_len = num_samples * block_align
+
+    # Canonical 44-byte PCM header followed by zeroed frames
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + data_len, b'WAVE',
+        b'fmt ', 16, 1, num_channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_len,
+    )
+    return header + bytes(data_len)
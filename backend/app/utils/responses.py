@@ -0,0 +1,20 @@
+"""
+Response Classes
+orjson-backed JSON response used as the application default
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module
+
+    Routes with a response_model keep FastAPI's Pydantic fast path; this class
+    only renders plain dict/list returns and explicit error payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
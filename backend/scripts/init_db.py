@@ -9,6 +9,8 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select
+
 from app.db.database import init_db, SessionLocal
 from app.db.models import User, UserRole
 from app.auth.jwt import get_password_hash
@@ -16,13 +18,16 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Built once; SQLAlchemy's compiled cache reuses the SQL on repeat executions
+_ADMIN_STMT = select(User).where(User.username == "admin").limit(1)
+
 
 def create_default_admin():
     """Create default admin user if it doesn't exist"""
     db = SessionLocal()
     try:
         # Check if admin exists
-        admin = db.query(User).filter(User.username == "admin").first()
+        admin = db.execute(_ADMIN_STMT).scalar_one_or_none()
         
         if admin:
             logger.info("default_admin_exists", extra_fields={"username": "admin"})
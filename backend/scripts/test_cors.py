@@ -1,5 +1,10 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# One keep-alive connection reused across requests
+SESSION = requests.Session()
+SESSION.mount("http://localhost", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 def test_cors():
     url = "http://localhost:8000/api/auth/login"
@@ -14,7 +19,7 @@ def test_cors():
     }
     
     try:
-        response = requests.options(url, headers=headers)
+        response = SESSION.options(url, headers=headers)
         
         print(f"Status Code: {response.status_code}")
         print("Headers:")
@@ -1,6 +1,11 @@
 
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+
+# One keep-alive connection reused across requests
+SESSION = requests.Session()
+SESSION.mount("http://localhost", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 BASE_URL = "http://localhost:8000/api"
 
@@ -19,7 +24,7 @@ def test_login():
     
     try:
         print("Sending login request with invalid Authorization header...")
-        response = requests.post(f"{BASE_URL}/auth/login", json=login_payload, headers=headers)
+        response = SESSION.post(f"{BASE_URL}/auth/login", json=login_payload, headers=headers)
         
         if response.status_code == 200:
             print("SUCCESS: Login successful!")
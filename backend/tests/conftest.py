@@ -4,6 +4,7 @@ Pytest configuration and fixtures
 
 import pytest
 from fastapi.testclient import TestClient
+from passlib.context import CryptContext
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -11,9 +12,16 @@ from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.db.database import get_db
 from app.db.models import Base
+from app.auth import jwt as jwt_module
 from app.auth.jwt import create_access_token
 
 
+# Tests exercise the hash/verify round trip, not KDF strength, so use a
+# minimum-cost bcrypt. Swapped at import so module-level hashes in test
+# files are cheap too; production code keeps its own context.
+jwt_module.pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
+
 # Test database (in-memory SQLite)
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
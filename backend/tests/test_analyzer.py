@@ -2,12 +2,43 @@
 Incident Analyzer Tests
 """
 
+import json
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from app.core.agent.analyzer import IncidentAnalyzer
 from app.models.incident import Incident, IncidentSummary, LogEntry, MetricPoint, TimelineEvent, RootCause, Severity, IncidentStatus
 
 
+# Canned Gemini brief, encoded once at import
+MOCK_BRIEF = {
+    "executive_summary": "Test summary",
+    "root_cause": {
+        "primary_cause": "Test cause",
+        "confidence": 0.9,
+        "evidence": ["Evidence 1"],
+        "contributing_factors": []
+    },
+    "impact": {
+        "users_affected": "100",
+        "estimated_cost": "$1000",
+        "services_impacted": ["test-service"],
+        "severity_justification": "High impact"
+    },
+    "recommended_actions": [
+        {
+            "priority": "HIGH",
+            "action": "Test action",
+            "estimated_time": "5 minutes",
+            "risk_level": "Low"
+        }
+    ],
+    "timeline_summary": "Test timeline"
+}
+MOCK_BRIEF_JSON = json.dumps(MOCK_BRIEF)
+
+
 @pytest.fixture
 def sample_incident():
     """Create a sample incident for testing"""
@@ -69,30 +100,7 @@ async def test_analyze_incident_mock(mock_gemini_class, sample_incident):
     """Test incident analysis with mocked Gemini client"""
     # Setup mock
     mock_gemini = Mock()
-    mock_gemini.generate_incident_brief.return_value = """{
-        "executive_summary": "Test summary",
-        "root_cause": {
-            "primary_cause": "Test cause",
-            "confidence": 0.9,
-            "evidence": ["Evidence 1"],
-            "contributing_factors": []
-        },
-        "impact": {
-            "users_affected": "100",
-            "estimated_cost": "$1000",
-            "services_impacted": ["test-service"],
-            "severity_justification": "High impact"
-        },
-        "recommended_actions": [
-            {
-                "priority": "HIGH",
-                "action": "Test action",
-                "estimated_time": "5 minutes",
-                "risk_level": "Low"
-            }
-        ],
-        "timeline_summary": "Test timeline"
-    }"""
+    mock_gemini.generate_incident_brief.return_value = MOCK_BRIEF_JSON
     mock_gemini_class.return_value = mock_gemini
     
     analyzer = IncidentAnalyzer()
@@ -141,16 +149,17 @@ def test_metrics_preparation(sample_incident):
     """Test metrics preparation"""
     analyzer = IncidentAnalyzer()
     
-    # Add more metrics
-    for i in range(100):
-        sample_incident.metrics.append(
-            MetricPoint(
-                timestamp=f"2024-01-01T00:{i:02d}:00Z",
-                service="test-service",
-                host="host1",
-                metrics={"cpu_percent": 50.0 + i}
-            )
+    # Add more metrics (literal inputs, so skip validation)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    sample_incident.metrics.extend([
+        MetricPoint.model_construct(
+            timestamp=start + timedelta(minutes=i),
+            service="test-service",
+            host="host1",
+            metrics={"cpu_percent": 50.0 + i}
         )
+        for i in range(100)
+    ])
     
     prepared = analyzer._prepare_metrics(sample_incident.metrics)
     
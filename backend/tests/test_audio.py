@@ -0,0 +1,91 @@
+"""
+Audio Utility Tests
+"""
+
+import pytest
+
+from app.models.voice import AudioFormat
+from app.utils.audio import (
+    convert_from_base64,
+    convert_to_base64,
+    create_silence_wav,
+    detect_audio_format,
+    validate_audio_size,
+)
+
+
+def test_base64_round_trip():
+    """Test audio bytes survive a base64 round trip"""
+    audio = create_silence_wav(0.1)
+
+    encoded = convert_to_base64(audio)
+
+    assert isinstance(encoded, str)
+    assert convert_from_base64(encoded) == audio
+
+
+def test_base64_accepts_buffers():
+    """Test bytearray and memoryview inputs encode like bytes"""
+    audio = create_silence_wav(0.1)
+
+    assert convert_to_base64(bytearray(audio)) == convert_to_base64(audio)
+    assert convert_to_base64(memoryview(audio)) == convert_to_base64(audio)
+
+
+def test_silence_wav_is_valid():
+    """Test the generated WAV has the expected header and frame count"""
+    import io
+    import wave
+
+    audio = create_silence_wav(0.5)
+
+    with wave.open(io.BytesIO(audio)) as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getnframes() == 8000
+        assert wav_file.readframes(8000) == bytes(16000)
+
+
+@pytest.mark.parametrize("header,expected", [
+    (b"RIFF\x00\x00\x00\x00WAVE", AudioFormat.WAV),
+    (b"ID3\x04" + bytes(8), AudioFormat.MP3),
+    (b"\xff\xfb\x90\x00" + bytes(8), AudioFormat.MP3),
+    (b"OggS" + bytes(8), AudioFormat.OGG),
+    (b"\x1a\x45\xdf\xa3" + bytes(8), AudioFormat.WEBM),
+    (b"RIFF\x00\x00\x00\x00AVI ", None),
+    (b"short", None),
+])
+def test_detect_audio_format(header, expected):
+    """Test format detection from file signatures"""
+    assert detect_audio_format(header) == expected
+
+
+def test_silence_wav_is_memoized():
+    """Test repeated calls with the same shape return the cached bytes"""
+    assert create_silence_wav(0.25) is create_silence_wav(0.25)
+    assert create_silence_wav(0.25, sample_rate=8000) != create_silence_wav(0.25)
+
+
+def test_silence_wav_matches_wave_module():
+    """Test the hand-built header matches what the wave module writes"""
+    import io
+    import wave
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(bytes(2 * 2 * 800))
+
+    assert create_silence_wav(0.1, sample_rate=8000, num_channels=2) == buffer.getvalue()
+
+
+def test_validate_audio_size_uses_byte_length():
+    """Test size checks count bytes, not elements, for typed buffers"""
+    from app.utils.audio import MAX_AUDIO_SIZE
+
+    assert validate_audio_size(bytes(1024))
+    assert not validate_audio_size(bytes(MAX_AUDIO_SIZE + 1))
+    # 'I' items are 4 bytes each, so len() would undercount
+    wide = memoryview(bytearray(MAX_AUDIO_SIZE + 4)).cast("I")
+    assert not validate_audio_size(wide)
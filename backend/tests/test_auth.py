@@ -7,6 +7,34 @@ from app.auth.jwt import create_access_token, decode_access_token, verify_passwo
 from app.db.models import User, UserRole
 from app.api.auth import register_user, login
 
+# Hash once per module: the KDF is deliberately slow
+ADMIN_PASSWORD_HASH = get_password_hash("admin123")
+USER_PASSWORD_HASH = get_password_hash("password123")
+
+
+@pytest.fixture
+def seeded_users(db_session):
+    """Insert an admin and a viewer in a single commit"""
+    users = [
+        User(
+            username="admin",
+            email="admin@test.com",
+            hashed_password=ADMIN_PASSWORD_HASH,
+            role=UserRole.ADMIN,
+            is_active=True
+        ),
+        User(
+            username="testuser",
+            email="test@test.com",
+            hashed_password=USER_PASSWORD_HASH,
+            role=UserRole.VIEWER,
+            is_active=True
+        ),
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+    return users
+
 
 def test_password_hashing():
     """Test password hashing and verification"""
@@ -45,22 +73,10 @@ def test_invalid_token():
         decode_access_token("invalid_token")
 
 
-def test_user_registration(client, db_session):
+def test_user_registration(client, seeded_users):
     """Test user registration"""
-    # First, create an admin user for registration
-    from app.db.models import User
-    from app.auth.jwt import get_password_hash
-    
-    admin = User(
-        username="admin",
-        email="admin@test.com",
-        hashed_password=get_password_hash("admin123"),
-        role=UserRole.ADMIN,
-        is_active=True
-    )
-    db_session.add(admin)
-    db_session.commit()
-    
+    admin = seeded_users[0]
+
     # Get admin token
     admin_token = create_access_token(
         data={"sub": "admin", "user_id": admin.id, "roles": ["admin"]}
@@ -82,22 +98,8 @@ def test_user_registration(client, db_session):
     assert response.json()["username"] == "newuser"
 
 
-def test_user_login(client, db_session):
+def test_user_login(client, seeded_users):
     """Test user login"""
-    from app.db.models import User
-    from app.auth.jwt import get_password_hash
-    
-    # Create test user
-    user = User(
-        username="testuser",
-        email="test@test.com",
-        hashed_password=get_password_hash("password123"),
-        role=UserRole.VIEWER,
-        is_active=True
-    )
-    db_session.add(user)
-    db_session.commit()
-    
     # Login
     response = client.post(
         "/api/auth/login",
@@ -0,0 +1,117 @@
+"""
+Data Loader Tests
+"""
+
+import orjson
+
+from app.core.data_loader import DataLoader
+
+SUMMARY = {
+    "incident_id": "INC-TEST-0001",
+    "title": "Pod restart loop → cascading 503s",
+    "severity": "P1",
+    "duration_minutes": 30,
+    "services_affected": ["api-service"],
+    "root_cause": {"primary": "Bad config → crash on boot"},
+}
+
+TIMELINE = [
+    {"time": "00:00", "event": "Deploy → rollout started", "impact": "None", "type": "incident_event"},
+]
+
+
+def write_incident(tmp_path):
+    """Write a generator-style incident directory with raw UTF-8 JSON"""
+    incident_dir = tmp_path / SUMMARY["incident_id"]
+    incident_dir.mkdir()
+    (incident_dir / "summary.json").write_bytes(orjson.dumps(SUMMARY, option=orjson.OPT_INDENT_2))
+    (incident_dir / "timeline.json").write_bytes(orjson.dumps(TIMELINE, option=orjson.OPT_INDENT_2))
+    return incident_dir
+
+
+def test_summary_and_timeline_read_as_utf8(tmp_path):
+    """Test non-ASCII text in summary/timeline decodes regardless of locale"""
+    incident_dir = write_incident(tmp_path)
+    loader = DataLoader(str(tmp_path))
+
+    summary = loader._load_summary(incident_dir)
+    timeline = loader._load_timeline(incident_dir)
+
+    assert summary.title == SUMMARY["title"]
+    assert summary.root_cause.primary == "Bad config → crash on boot"
+    assert timeline[0].event == "Deploy → rollout started"
+
+
+def test_migrated_summary_loads(tmp_path):
+    """Test a summary rewritten by migrate_summaries.py keeps its UTF-8 text"""
+    import importlib.util
+    from pathlib import Path
+
+    script = Path(__file__).resolve().parents[2] / "migrate_summaries.py"
+    spec = importlib.util.spec_from_file_location("migrate_summaries", script)
+    migrate_summaries = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migrate_summaries)
+
+    incident_dir = write_incident(tmp_path)
+    assert migrate_summaries.migrate_summary(incident_dir / "summary.json", SUMMARY["incident_id"]) is True
+    # A rerun leaves the migrated summary and its backup alone
+    assert migrate_summaries.migrate_summary(incident_dir / "summary.json", SUMMARY["incident_id"]) is False
+
+    summary = DataLoader(str(tmp_path))._load_summary(incident_dir)
+
+    assert summary.title == SUMMARY["title"]
+    assert summary.mttr_actual == "30m"
+    assert (incident_dir / "summary.json.bak").read_bytes() == orjson.dumps(SUMMARY, option=orjson.OPT_INDENT_2)
+
+
+def test_compressed_jsonl_round_trip(tmp_path):
+    """Test logs/metrics saved as .jsonl.gz load like plain JSONL"""
+    import gzip
+
+    incident_dir = write_incident(tmp_path)
+    log = {
+        "timestamp": "2026-01-01T00:00:00Z", "level": "ERROR", "service": "api-service",
+        "host": "prod-app-01", "message": "Upstream timeout → retrying",
+        "metadata": {"error_code": "504", "retry_count": 2},
+    }
+    metric = {
+        "timestamp": "2026-01-01T00:00:00Z", "service": "api-service",
+        "host": "prod-app-01", "metrics": {"cpu_percent": 42.5},
+    }
+    with gzip.open(incident_dir / "logs.jsonl.gz", "wb", compresslevel=1) as f:
+        f.write(orjson.dumps(log) + b"\n" + b"not json\n")
+    with gzip.open(incident_dir / "metrics.jsonl.gz", "wb", compresslevel=1) as f:
+        f.write(orjson.dumps(metric) + b"\n")
+
+    loader = DataLoader(str(tmp_path))
+    logs = loader._load_logs(incident_dir)
+    metrics = loader._load_metrics(incident_dir)
+
+    assert len(logs) == 1
+    assert logs[0].message == log["message"]
+    assert logs[0].metadata.retry_count == 2
+    assert metrics[0].metrics == {"cpu_percent": 42.5}
+
+
+def test_log_metadata_round_trips_unchanged(tmp_path):
+    """Test log metadata is served with exactly the keys the source had"""
+    from app.api.incidents import _LOGS_ADAPTER
+
+    incident_dir = write_incident(tmp_path)
+    metadata = [
+        {"error_code": "504"},
+        {"retry_count": 0, "upstream": "payments-db"},
+        {"webhook_payload": {"event": "trigger"}, "error_code": None},
+    ]
+    (incident_dir / "logs.jsonl").write_bytes(b"".join(
+        orjson.dumps({
+            "timestamp": "2026-01-01T00:00:00Z", "level": "ERROR", "service": "api-service",
+            "host": "prod-app-01", "message": "Upstream timeout", "metadata": entry,
+        }) + b"\n"
+        for entry in metadata
+    ))
+
+    logs = DataLoader(str(tmp_path))._load_logs(incident_dir)
+    served = orjson.loads(_LOGS_ADAPTER.dump_json(logs))
+
+    assert [log["metadata"] for log in served] == metadata
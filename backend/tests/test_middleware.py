@@ -0,0 +1,179 @@
+"""
+Middleware Tests
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.error_handler import GlobalErrorMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+
+
+def make_rate_limited_app(per_minute: int) -> FastAPI:
+    """Create a minimal app wrapped in the rate limiter"""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    app.add_middleware(RateLimitMiddleware, per_minute=per_minute)
+    return app
+
+
+def test_security_headers_added(client):
+    """Test security headers are present on responses"""
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert "default-src 'self'" in response.headers["content-security-policy"]
+    assert response.headers["permissions-policy"] == "geolocation=(), microphone=(), camera=()"
+
+
+def test_security_headers_not_duplicated(client):
+    """Test repeated requests don't accumulate headers"""
+    client.get("/")
+    response = client.get("/")
+
+    assert len(response.headers.get_list("x-frame-options")) == 1
+
+
+def test_security_headers_skipped_for_health(client):
+    """Test health probes bypass the security headers middleware"""
+    response = client.get("/health")
+
+    assert "x-frame-options" not in response.headers
+
+
+def test_rate_limit_rejects_when_bucket_empty():
+    """Test requests beyond the bucket capacity get 429"""
+    client = TestClient(make_rate_limited_app(per_minute=3))
+
+    statuses = [client.get("/ping").status_code for _ in range(4)]
+
+    assert statuses == [200, 200, 200, 429]
+    response = client.get("/ping")
+    assert response.json() == {"detail": "Rate limit exceeded"}
+    assert "retry-after" in response.headers
+
+
+def test_rate_limit_exempts_health():
+    """Test health probes are never throttled"""
+    client = TestClient(make_rate_limited_app(per_minute=1))
+
+    statuses = [client.get("/health").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 200]
+
+
+def test_rate_limit_buckets_bounded_under_many_clients():
+    """Test more than max_clients active keys evicts the least recently seen"""
+    limiter = RateLimitMiddleware(make_rate_limited_app(1), per_minute=1, max_clients=3)
+
+    assert limiter._consume("10.0.0.1", 0.0) is True
+    for i in range(2, 8):
+        assert limiter._consume(f"10.0.0.{i}", 0.0) is True
+    assert limiter._consume("10.0.0.7", 0.0) is False
+
+    assert list(limiter._buckets) == ["10.0.0.5", "10.0.0.6", "10.0.0.7"]
+    # The evicted client starts over with a full bucket
+    assert limiter._consume("10.0.0.1", 0.0) is True
+    assert len(limiter._buckets) == 3
+
+
+def test_cors_preflight_allowed_origin(client):
+    """Test preflight from a configured origin is accepted"""
+    response = client.options(
+        "/api/incidents/",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+def test_cors_preflight_unknown_origin(client):
+    """Test preflight from an unknown origin is rejected"""
+    response = client.options(
+        "/api/incidents/",
+        headers={
+            "Origin": "http://evil.example.com",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    assert response.status_code == 400
+
+
+def test_large_responses_compressed(client):
+    """Test large JSON payloads are gzip-compressed"""
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers  # below minimum size
+
+    response = client.get("/api/incidents/INC-2026-0001/logs?limit=50", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 50
+
+
+def test_unhandled_exception_returns_json_500():
+    """Test uncaught errors become a canned JSON 500"""
+    app = FastAPI()
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("secret details")
+
+    app.add_middleware(GlobalErrorMiddleware, debug=False)
+    response = TestClient(app).get("/boom")
+
+    assert response.status_code == 500
+    assert response.json() == {"error": "Internal server error", "detail": "An error occurred"}
+
+
+def test_rate_limit_exceeded_handler_returns_429():
+    """Test the slowapi handler returns the canned 429 response"""
+    from unittest.mock import Mock
+    from app.middleware.rate_limit import rate_limit_exceeded_handler
+
+    response = rate_limit_exceeded_handler(Mock(), Mock(spec=[]))
+
+    assert response.status_code == 429
+    assert response.body == b'{"detail":"Rate limit exceeded"}'
+    assert response.headers["retry-after"] == "60"
+
+
+def test_default_response_class_is_orjson(client):
+    """Test plain dict routes render through orjson"""
+    from app.utils.responses import ORJSONResponse
+
+    assert ORJSONResponse({1: "a"}).body == b'{"1":"a"}'
+    response = client.get("/api/incidents/")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_rate_limiter_is_outermost_middleware(monkeypatch):
+    """Test the rate limiter wraps every other middleware"""
+    import importlib.util
+    from pathlib import Path
+
+    from app.config import settings
+
+    # Build a fresh app with rate limiting forced on, whatever the environment says
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    main_path = Path(__file__).resolve().parents[1] / "app" / "main.py"
+    spec = importlib.util.spec_from_file_location("_rate_limited_main", main_path)
+    main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(main)
+
+    assert main.app.user_middleware[0].cls is RateLimitMiddleware
@@ -6,11 +6,13 @@ Generates realistic synthetic data for incident scenarios
 __version__ = "1.0.0"
 
 from .logs import LogGenerator
-from .metrics import MetricsGenerator
-from .incidents import IncidentGenerator
+from .metrics import MetricsGenerator, write_ndjson
+from .incidents import IncidentGenerator, generate_many
 
 __all__ = [
     "LogGenerator",
     "MetricsGenerator", 
-    "IncidentGenerator"
+    "write_ndjson",
+    "IncidentGenerator",
+    "generate_many"
 ]
\ No newline at end of file
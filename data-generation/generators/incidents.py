@@ -3,18 +3,47 @@ Incident Generator - Orchestrates generation of complete incident datasets
 Combines logs, metrics, and timeline into coherent incident scenarios
 """
 
-import json
+import gzip
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import orjson
 import yaml
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 from .logs import LogGenerator, LogEntry
 from .metrics import MetricsGenerator, MetricPoint
 
+# Entries joined per write() when saving JSONL, bounding peak memory
+JSONL_CHUNK_SIZE = 10_000
+
+# Encoded chunks allowed in flight between the generator and writer thread
+JSONL_QUEUE_DEPTH = 4
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Scenario YAML keys that map onto IncidentScenario fields
+_SCENARIO_FIELDS = frozenset({
+    'incident_id', 'incident_type', 'severity', 'title', 'description',
+    'start_time', 'duration_minutes', 'services_affected', 'timeline',
+    'root_cause', 'mitigation_steps', 'lessons_learned', 'estimated_cost',
+    'users_impacted', 'mttr_actual', 'technical_metadata', 'business_impact'
+})
+
 
-@dataclass
+@dataclass(slots=True)
 class IncidentScenario:
     """Complete incident scenario definition"""
     incident_id: str
@@ -38,27 +67,102 @@ class IncidentScenario:
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> 'IncidentScenario':
         """Load incident scenario from YAML file"""
-        with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        # Parse start_time if it's a string
-        if isinstance(data.get('start_time'), str):
-            data['start_time'] = datetime.fromisoformat(data['start_time'])
+        with open(yaml_path, 'rb') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
         
         # Extract only fields that belong to IncidentScenario
-        valid_fields = {
-            'incident_id', 'incident_type', 'severity', 'title', 'description',
-            'start_time', 'duration_minutes', 'services_affected', 'timeline',
-            'root_cause', 'mitigation_steps', 'lessons_learned', 'estimated_cost',
-            'users_impacted', 'mttr_actual', 'technical_metadata', 'business_impact'
-        }
-        
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
-        
+        filtered_data = {k: data[k] for k in data.keys() & _SCENARIO_FIELDS}
+
+        # Unquoted ISO timestamps already load as datetime; quoted ones are str
+        start_time = filtered_data.get('start_time')
+        if type(start_time) is str:
+            filtered_data['start_time'] = datetime.fromisoformat(start_time)
+
         return cls(**filtered_data)
 
 
-@dataclass
+def _write_jsonl(path: Path, lines: Iterable[bytes], compress: bool = False) -> int:
+    """Write encoded lines as JSONL, one write() per chunk instead of per line
+
+    With compress=True the file is written as <path>.gz using fast gzip
+    (level 1); repeated field names and hosts compress very well.
+
+    File writes (and gzip compression) happen on a background thread fed
+    through a bounded queue. Both release the GIL, so I/O overlaps with
+    generating and encoding the next chunk.
+
+    Returns:
+        Number of lines written
+    """
+    if compress:
+        opener = gzip.open(path.with_name(path.name + '.gz'), 'wb', compresslevel=1)
+    else:
+        opener = open(path, 'wb')
+    
+    chunks: queue.Queue = queue.Queue(maxsize=JSONL_QUEUE_DEPTH)
+    errors: List[BaseException] = []
+    
+    def _writer() -> None:
+        with opener as f:
+            while (data := chunks.get()) is not None:
+                # Keep draining after a failure so the producer never blocks
+                if not errors:
+                    try:
+                        f.write(data)
+                    except BaseException as exc:
+                        errors.append(exc)
+    
+    writer = threading.Thread(target=_writer, name=f"jsonl-writer-{path.name}")
+    writer.start()
+    
+    lines = iter(lines)
+    count = 0
+    try:
+        while not errors and (chunk := list(islice(lines, JSONL_CHUNK_SIZE))):
+            chunks.put(b'\n'.join(chunk) + b'\n')
+            count += len(chunk)
+    finally:
+        chunks.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return count
+
+
+def _save_incident_files(
+    incident_dir: Path,
+    log_lines: Iterable[bytes],
+    metric_lines: Iterable[bytes],
+    timeline: List[Dict],
+    summary: Dict,
+    compress: bool = False
+):
+    """Write the four incident files; logs and metrics may be lazy streams"""
+    incident_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Save logs
+    log_count = _write_jsonl(incident_dir / "logs.jsonl", log_lines, compress)
+    
+    # Save metrics
+    metric_count = _write_jsonl(incident_dir / "metrics.jsonl", metric_lines, compress)
+    
+    # Save timeline
+    timeline_file = incident_dir / "timeline.json"
+    with open(timeline_file, 'wb') as f:
+        f.write(orjson.dumps(timeline, option=orjson.OPT_INDENT_2))
+    
+    # Save summary
+    summary_file = incident_dir / "summary.json"
+    with open(summary_file, 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    
+    print(f"✓ Saved incident data to {incident_dir}")
+    print(f"  - {log_count} log entries")
+    print(f"  - {metric_count} metric points")
+    print(f"  - {len(timeline)} timeline events")
+
+
+@dataclass(slots=True)
 class IncidentDataset:
     """Complete generated dataset for an incident"""
     scenario: IncidentScenario
@@ -67,44 +171,81 @@ class IncidentDataset:
     timeline: List[Dict]
     summary: Dict
     
-    def save_to_directory(self, output_dir: Path):
-        """Save all incident data to directory"""
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        incident_dir = output_dir / self.scenario.incident_id
-        incident_dir.mkdir(exist_ok=True)
-        
-        # Save logs
-        logs_file = incident_dir / "logs.jsonl"
-        with open(logs_file, 'w') as f:
-            for log in self.logs:
-                f.write(log.to_json() + '\n')
+    def save_to_directory(self, output_dir: Path, compress: bool = False):
+        """Save all incident data to directory
         
-        # Save metrics
-        metrics_file = incident_dir / "metrics.jsonl"
-        with open(metrics_file, 'w') as f:
-            for metric in self.metrics:
-                f.write(metric.to_json() + '\n')
-        
-        # Save timeline
-        timeline_file = incident_dir / "timeline.json"
-        with open(timeline_file, 'w') as f:
-            json.dump(self.timeline, f, indent=2)
-        
-        # Save summary
-        summary_file = incident_dir / "summary.json"
-        with open(summary_file, 'w') as f:
-            json.dump(self.summary, f, indent=2)
-        
-        print(f"✓ Saved incident data to {incident_dir}")
-        print(f"  - {len(self.logs)} log entries")
-        print(f"  - {len(self.metrics)} metric points")
-        print(f"  - {len(self.timeline)} timeline events")
+        Args:
+            output_dir: Parent directory for the incident folder
+            compress: Write logs/metrics as gzipped .jsonl.gz files
+        """
+        _save_incident_files(
+            output_dir / self.scenario.incident_id,
+            (log.to_json_fast() for log in self.logs),
+            (metric.to_json_bytes() for metric in self.metrics),
+            self.timeline,
+            self.summary,
+            compress
+        )
 
 
 class IncidentGenerator:
     """Generates complete incident datasets from scenario definitions"""
     
+    # Metric phase configs are constant and only read by MetricsGenerator,
+    # so they are built once per process and shared as read-only mappings
+    
+    # Metric phases for BMR recovery
+    _BMR_PHASES = (
+        # Pre-incident (normal)
+        MappingProxyType({"cpu": 25, "memory": 1200, "requests": 150, "error_rate": 0.002, "latency": 45, "recovering": False}),
+        # Server failure detected
+        MappingProxyType({"cpu": 0, "memory": 0, "requests": 0, "error_rate": 1.0, "latency": 0, "recovering": False}),
+        # BMR in progress (still down)
+        MappingProxyType({"cpu": 0, "memory": 0, "requests": 0, "error_rate": 1.0, "latency": 0, "recovering": False}),
+        # OS restored, DB installing
+        MappingProxyType({"cpu": 5, "memory": 200, "requests": 0, "error_rate": 1.0, "latency": 0, "recovering": True}),
+        # DB restored, verification
+        MappingProxyType({"cpu": 15, "memory": 800, "requests": 20, "error_rate": 0.3, "latency": 500, "recovering": True}),
+        # Service back online
+        MappingProxyType({"cpu": 25, "memory": 1200, "requests": 140, "error_rate": 0.01, "latency": 60, "recovering": True})
+    )
+    
+    # Metric phases for connection pool exhaustion
+    _CONNECTION_POOL_PHASES = (
+        MappingProxyType({"cpu": 25, "memory": 1200, "requests": 150, "error_rate": 0.002, "latency": 45,
+                          "active_connections": 50, "max_connections": 100, "pool_usage": 0.5}),
+        MappingProxyType({"cpu": 30, "memory": 1400, "requests": 160, "error_rate": 0.01, "latency": 80,
+                          "active_connections": 50, "max_connections": 100, "pool_usage": 0.7}),
+        MappingProxyType({"cpu": 35, "memory": 1800, "requests": 150, "error_rate": 0.05, "latency": 200,
+                          "active_connections": 50, "max_connections": 100, "pool_usage": 0.9}),
+        MappingProxyType({"cpu": 40, "memory": 2200, "requests": 100, "error_rate": 0.15, "latency": 500,
+                          "active_connections": 50, "max_connections": 100, "pool_usage": 0.98}),
+        MappingProxyType({"cpu": 30, "memory": 1600, "requests": 130, "error_rate": 0.03, "latency": 100,
+                          "active_connections": 50, "max_connections": 150, "pool_usage": 0.5}),
+        MappingProxyType({"cpu": 25, "memory": 1300, "requests": 145, "error_rate": 0.005, "latency": 50,
+                          "active_connections": 50, "max_connections": 150, "pool_usage": 0.4})
+    )
+    
+    # Metric phases for memory leak
+    _MEMORY_LEAK_PHASES = (
+        MappingProxyType({"cpu": 25, "memory_base": 1200, "memory_growth": 0, "requests": 150, "error_rate": 0.002, "latency": 45}),
+        MappingProxyType({"cpu": 28, "memory_base": 1200, "memory_growth": 400, "requests": 145, "error_rate": 0.005, "latency": 60}),
+        MappingProxyType({"cpu": 32, "memory_base": 1200, "memory_growth": 900, "requests": 135, "error_rate": 0.02, "latency": 100}),
+        MappingProxyType({"cpu": 38, "memory_base": 1200, "memory_growth": 1500, "requests": 110, "error_rate": 0.08, "latency": 250}),
+        MappingProxyType({"cpu": 30, "memory_base": 1200, "memory_growth": 200, "requests": 140, "error_rate": 0.01, "latency": 70}),
+        MappingProxyType({"cpu": 26, "memory_base": 1200, "memory_growth": 0, "requests": 148, "error_rate": 0.003, "latency": 48})
+    )
+    
+    # Generic degradation phases
+    _GENERIC_PHASES = (
+        MappingProxyType({"cpu": 25, "memory": 1200, "requests": 150, "error_rate": 0.002, "latency": 45}),
+        MappingProxyType({"cpu": 35, "memory": 1400, "requests": 140, "error_rate": 0.02, "latency": 100}),
+        MappingProxyType({"cpu": 50, "memory": 1600, "requests": 120, "error_rate": 0.08, "latency": 200}),
+        MappingProxyType({"cpu": 65, "memory": 1800, "requests": 90, "error_rate": 0.15, "latency": 350}),
+        MappingProxyType({"cpu": 40, "memory": 1500, "requests": 130, "error_rate": 0.04, "latency": 120}),
+        MappingProxyType({"cpu": 28, "memory": 1250, "requests": 145, "error_rate": 0.005, "latency": 55})
+    )
+    
     def __init__(self, scenario: IncidentScenario):
         """Initialize incident generator
         
@@ -147,42 +288,58 @@ class IncidentGenerator:
             summary=summary
         )
     
+    def generate_to_directory(self, output_dir: Path, compress: bool = False):
+        """Generate the dataset and save it, streaming logs straight to disk
+        
+        Same files as generate().save_to_directory(), but log rows and
+        metric points are encoded as they are produced instead of being
+        held as full LogEntry/MetricPoint lists.
+        
+        Args:
+            output_dir: Parent directory for the incident folder
+            compress: Write logs/metrics as gzipped .jsonl.gz files
+        """
+        phases = self._extract_phases_from_timeline()
+        log_lines = (orjson.dumps(row) for row in self._iter_incident_logs(phases))
+        
+        _save_incident_files(
+            output_dir / self.scenario.incident_id,
+            log_lines,
+            (metric.to_json_bytes() for metric in self._iter_incident_metrics(phases)),
+            self._build_detailed_timeline(),
+            self._create_summary(),
+            compress
+        )
+    
     def _extract_phases_from_timeline(self) -> List[Dict]:
         """Extract incident phases from timeline"""
-        phases = []
-        
-        for idx, event in enumerate(self.scenario.timeline):
-            # Parse time from timeline event
+        # Minutes from start for each event ("HH:MM"), parsed once
+        starts = []
+        for event in self.scenario.timeline:
             event_time = event.get('time', '00:00')
-            
-            # Calculate minutes from start
             if ':' in event_time:
-                hours, minutes = map(int, event_time.split(':'))
-                minutes_from_start = hours * 60 + minutes
+                hours, minutes = event_time.split(':')
+                starts.append(int(hours) * 60 + int(minutes))
             else:
-                minutes_from_start = 0
-            
-            phases.append({
-                'event': event.get('event', ''),
-                'impact': event.get('impact', ''),
-                'minutes_from_start': minutes_from_start,
-                'duration': 0  # Will be calculated
-            })
+                starts.append(0)
         
-        # Calculate durations between phases
-        for i in range(len(phases) - 1):
-            phases[i]['duration'] = phases[i + 1]['minutes_from_start'] - phases[i]['minutes_from_start']
+        # Each phase runs until the next event; the last until incident end
+        ends = starts[1:] + [self.scenario.duration_minutes]
         
-        # Last phase duration
-        if phases:
-            phases[-1]['duration'] = self.scenario.duration_minutes - phases[-1]['minutes_from_start']
+        phases = [
+            {
+                'event': event.get('event', ''),
+                'impact': event.get('impact', ''),
+                'minutes_from_start': start,
+                'duration': end - start
+            }
+            for event, start, end in zip(self.scenario.timeline, starts, ends)
+        ]
         
         return phases
     
-    def _generate_incident_logs(self, phases: List[Dict]) -> List[LogEntry]:
-        """Generate logs for the incident"""
-        all_logs = []
-        
+    def _severity_progression(self) -> List[float]:
+        """Error rate per phase for this incident type"""
         # Map incident type to error progression
         if self.scenario.incident_type == "bmr_recovery":
             # BMR has distinct phases: failure, recovery start, restoration
@@ -194,93 +351,76 @@ class IncidentGenerator:
         else:
             severity_progression = [0.0, 0.2, 0.5, 0.7, 0.4, 0.1]
         
+        return severity_progression
+    
+    def _iter_incident_logs(self, phases: List[Dict]) -> Iterator[Dict]:
+        """Stream incident log rows without materializing LogEntry objects"""
+        return self.log_gen.iter_incident_logs(
+            incident_type=self._map_incident_to_log_type(),
+            duration_minutes=self.scenario.duration_minutes,
+            severity_progression=self._severity_progression()
+        )
+    
+    def _generate_incident_logs(self, phases: List[Dict]) -> List[LogEntry]:
+        """Generate logs for the incident"""
+        all_logs = []
+        
         logs = self.log_gen.generate_incident_logs(
             incident_type=self._map_incident_to_log_type(),
             duration_minutes=self.scenario.duration_minutes,
-            severity_progression=severity_progression
+            severity_progression=self._severity_progression()
         )
         
         all_logs.extend(logs)
         
         return all_logs
     
-    def _generate_incident_metrics(self, phases: List[Dict]) -> List[MetricPoint]:
-        """Generate metrics for the incident"""
-        
-        # Build phase configurations based on incident type
+    def _metric_phase_configs(self) -> Tuple[Mapping[str, Any], ...]:
+        """Metric phase configurations for this incident type"""
         if self.scenario.incident_type == "bmr_recovery":
-            phase_configs = self._build_bmr_phases()
+            return self._build_bmr_phases()
         elif "connection" in self.scenario.incident_type.lower():
-            phase_configs = self._build_connection_pool_phases()
+            return self._build_connection_pool_phases()
         elif "memory" in self.scenario.incident_type.lower():
-            phase_configs = self._build_memory_leak_phases()
+            return self._build_memory_leak_phases()
         else:
-            phase_configs = self._build_generic_phases()
-        
+            return self._build_generic_phases()
+    
+    def _iter_incident_metrics(self, phases: List[Dict]) -> Iterator[MetricPoint]:
+        """Stream incident metrics without materializing the full list"""
+        return self.metrics_gen.iter_incident_metrics(
+            incident_type=self.scenario.incident_type,
+            duration_minutes=self.scenario.duration_minutes,
+            phases=self._metric_phase_configs(),
+            interval_seconds=60
+        )
+    
+    def _generate_incident_metrics(self, phases: List[Dict]) -> List[MetricPoint]:
+        """Generate metrics for the incident"""
         metrics = self.metrics_gen.generate_incident_metrics(
             incident_type=self.scenario.incident_type,
             duration_minutes=self.scenario.duration_minutes,
-            phases=phase_configs,
+            phases=self._metric_phase_configs(),
             interval_seconds=60
         )
         
         return metrics
     
-    def _build_bmr_phases(self) -> List[Dict]:
+    def _build_bmr_phases(self) -> Tuple[Mapping[str, Any], ...]:
         """Build metric phases for BMR recovery"""
-        return [
-            # Pre-incident (normal)
-            {"cpu": 25, "memory": 1200, "requests": 150, "error_rate": 0.002, "latency": 45, "recovering": False},
-            # Server failure detected
-            {"cpu": 0, "memory": 0, "requests": 0, "error_rate": 1.0, "latency": 0, "recovering": False},
-            # BMR in progress (still down)
-            {"cpu": 0, "memory": 0, "requests": 0, "error_rate": 1.0, "latency": 0, "recovering": False},
-            # OS restored, DB installing
-            {"cpu": 5, "memory": 200, "requests": 0, "error_rate": 1.0, "latency": 0, "recovering": True},
-            # DB restored, verification
-            {"cpu": 15, "memory": 800, "requests": 20, "error_rate": 0.3, "latency": 500, "recovering": True},
-            # Service back online
-            {"cpu": 25, "memory": 1200, "requests": 140, "error_rate": 0.01, "latency": 60, "recovering": True}
-        ]
+        return self._BMR_PHASES
     
-    def _build_connection_pool_phases(self) -> List[Dict]:
+    def _build_connection_pool_phases(self) -> Tuple[Mapping[str, Any], ...]:
         """Build metric phases for connection pool exhaustion"""
-        return [
-            {"cpu": 25, "memory": 1200, "requests": 150, "error_rate": 0.002, "latency": 45, 
-             "active_connections": 50, "max_connections": 100, "pool_usage": 0.5},
-            {"cpu": 30, "memory": 1400, "requests": 160, "error_rate": 0.01, "latency": 80,
-             "active_connections": 50, "max_connections": 100, "pool_usage": 0.7},
-            {"cpu": 35, "memory": 1800, "requests": 150, "error_rate": 0.05, "latency": 200,
-             "active_connections": 50, "max_connections": 100, "pool_usage": 0.9},
-            {"cpu": 40, "memory": 2200, "requests": 100, "error_rate": 0.15, "latency": 500,
-             "active_connections": 50, "max_connections": 100, "pool_usage": 0.98},
-            {"cpu": 30, "memory": 1600, "requests": 130, "error_rate": 0.03, "latency": 100,
-             "active_connections": 50, "max_connections": 150, "pool_usage": 0.5},
-            {"cpu": 25, "memory": 1300, "requests": 145, "error_rate": 0.005, "latency": 50,
-             "active_connections": 50, "max_connections": 150, "pool_usage": 0.4}
-        ]
+        return self._CONNECTION_POOL_PHASES
     
-    def _build_memory_leak_phases(self) -> List[Dict]:
+    def _build_memory_leak_phases(self) -> Tuple[Mapping[str, Any], ...]:
         """Build metric phases for memory leak"""
-        return [
-            {"cpu": 25, "memory_base": 1200, "memory_growth": 0, "requests": 150, "error_rate": 0.002, "latency": 45},
-            {"cpu": 28, "memory_base": 1200, "memory_growth": 400, "requests": 145, "error_rate": 0.005, "latency": 60},
-            {"cpu": 32, "memory_base": 1200, "memory_growth": 900, "requests": 135, "error_rate": 0.02, "latency": 100},
-            {"cpu": 38, "memory_base": 1200, "memory_growth": 1500, "requests": 110, "error_rate": 0.08, "latency": 250},
-            {"cpu": 30, "memory_base": 1200, "memory_growth": 200, "requests": 140, "error_rate": 0.01, "latency": 70},
-            {"cpu": 26, "memory_base": 1200, "memory_growth": 0, "requests": 148, "error_rate": 0.003, "latency": 48}
-        ]
+        return self._MEMORY_LEAK_PHASES
     
-    def _build_generic_phases(self) -> List[Dict]:
+    def _build_generic_phases(self) -> Tuple[Mapping[str, Any], ...]:
         """Build generic degradation phases"""
-        return [
-            {"cpu": 25, "memory": 1200, "requests": 150, "error_rate": 0.002, "latency": 45},
-            {"cpu": 35, "memory": 1400, "requests": 140, "error_rate": 0.02, "latency": 100},
-            {"cpu": 50, "memory": 1600, "requests": 120, "error_rate": 0.08, "latency": 200},
-            {"cpu": 65, "memory": 1800, "requests": 90, "error_rate": 0.15, "latency": 350},
-            {"cpu": 40, "memory": 1500, "requests": 130, "error_rate": 0.04, "latency": 120},
-            {"cpu": 28, "memory": 1250, "requests": 145, "error_rate": 0.005, "latency": 55}
-        ]
+        return self._GENERIC_PHASES
     
     def _map_incident_to_log_type(self) -> str:
         """Map incident type to log message category"""
@@ -322,4 +462,32 @@ class IncidentGenerator:
             "users_impacted": self.scenario.users_impacted,
             "mitigation_steps": self.scenario.mitigation_steps,
             "lessons_learned": self.scenario.lessons_learned
-        }
\ No newline at end of file
+        }
+
+
+def _generate_and_save(scenario: IncidentScenario, output_dir: Path, compress: bool) -> str:
+    """Worker entry point: generate one incident and write it to disk"""
+    IncidentGenerator(scenario).generate_to_directory(output_dir, compress)
+    return scenario.incident_id
+
+
+def generate_many(
+    scenarios: List[IncidentScenario],
+    output_dir: Path,
+    workers: Optional[int] = None,
+    compress: bool = False
+) -> List[str]:
+    """Generate and save several incidents in parallel, one process each
+    
+    Args:
+        scenarios: Incident scenarios to generate
+        output_dir: Directory the per-incident folders are written to
+        workers: Process count (defaults to the CPU count)
+        compress: Write logs/metrics as gzipped .jsonl.gz files
+        
+    Returns:
+        Incident IDs in the order they were given
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_generate_and_save, scenario, output_dir, compress) for scenario in scenarios]
+        return [future.result() for future in futures]
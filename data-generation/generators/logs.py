@@ -3,12 +3,24 @@ Log Generator - Creates realistic application logs
 Generates logs with different severity levels and patterns
 """
 
-import json
+import os
 import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
+from dataclasses import dataclass
 from enum import Enum
+from json.encoder import encode_basestring
+
+import numpy as np
+import orjson
+
+
+# Static Java-style trace attached to ERROR logs, joined once at import
+_STACK_TRACE = "\n".join([
+    "  at com.wardenxt.payment.PaymentService.processPayment(PaymentService.java:142)",
+    "  at com.wardenxt.api.PaymentController.handleRequest(PaymentController.java:89)",
+    "  at com.wardenxt.db.ConnectionPool.acquireConnection(ConnectionPool.java:234)"
+])
 
 
 class LogLevel(Enum):
@@ -20,7 +32,7 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Single log entry structure"""
     timestamp: str
@@ -35,12 +47,95 @@ class LogEntry:
     metadata: Optional[Dict] = None
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary, excluding None values"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        """Convert to dictionary, excluding None values
+
+        Built from the slot names rather than asdict() to skip the recursive
+        deep copy; metadata is shared by reference.
+        """
+        return {k: v for k in self.__slots__ if (v := getattr(self, k)) is not None}
     
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 JSON bytes"""
+        return orjson.dumps(self.to_dict())
+
+    def to_json_fast(self) -> bytes:
+        """Encode as JSON bytes without building an intermediate dict
+
+        Produces the same bytes as to_json_bytes(). timestamp, level and host
+        come from fixed templates and never need escaping; free-text fields
+        go through the stdlib string encoder.
+        """
+        parts = [
+            '{"timestamp":"', self.timestamp,
+            '","level":"', self.level,
+            '","service":', encode_basestring(self.service),
+            ',"host":"', self.host,
+            '","message":', encode_basestring(self.message),
+        ]
+        for key, value in (
+            ("thread_id", self.thread_id),
+            ("request_id", self.request_id),
+            ("user_id", self.user_id),
+            ("stack_trace", self.stack_trace),
+        ):
+            if value is not None:
+                parts += (',"', key, '":', encode_basestring(value))
+        if self.metadata is not None:
+            parts += (',"metadata":', orjson.dumps(self.metadata).decode())
+        parts.append("}")
+        return "".join(parts).encode()
+
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
+
+
+@dataclass
+class LogBatch:
+    """Column-oriented batch of log entries (one list per field)
+    
+    Holds the same data as a List[LogEntry] without a Python object per
+    row. Optional columns use None where a row has no value.
+    """
+    service: str
+    timestamps: List[str]
+    levels: List[str]
+    hosts: List[str]
+    messages: List[str]
+    thread_ids: List[str]
+    request_ids: List[str]
+    stack_traces: List[Optional[str]]
+    error_codes: List[Optional[str]]
+    retry_counts: List[Optional[int]]
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def iter_rows(self) -> Iterator[Dict]:
+        """Yield rows as dicts matching LogEntry.to_dict()"""
+        service = self.service
+        for timestamp, level, host, message, thread_id, request_id, stack_trace, error_code, retry_count in zip(
+            self.timestamps, self.levels, self.hosts, self.messages, self.thread_ids,
+            self.request_ids, self.stack_traces, self.error_codes, self.retry_counts
+        ):
+            row = {
+                "timestamp": timestamp,
+                "level": level,
+                "service": service,
+                "host": host,
+                "message": message,
+                "thread_id": thread_id,
+                "request_id": request_id,
+            }
+            if stack_trace is not None:
+                row["stack_trace"] = stack_trace
+            if error_code is not None:
+                row["metadata"] = {"error_code": error_code, "retry_count": retry_count}
+            yield row
+    
+    def as_entries(self) -> List[LogEntry]:
+        """Materialize the batch as LogEntry objects"""
+        return [LogEntry(**row) for row in self.iter_rows()]
 
 
 class LogGenerator:
@@ -60,6 +155,11 @@ class LogGenerator:
     
     # Host naming patterns
     HOST_PREFIX = ["prod-app", "prod-db", "prod-cache", "prod-lb"]
+    HOSTS = [f"{prefix}-{number:02d}" for prefix in HOST_PREFIX for number in range(1, 6)]
+    # Object array so gathered hosts are the same shared str objects
+    _HOSTS_ARR = np.array(HOSTS, dtype=object)
+    
+    ERROR_CODES = ["500", "503", "504"]
     
     # Common error messages
     ERROR_MESSAGES = {
@@ -112,9 +212,14 @@ class LogGenerator:
             start_time: When to start generating logs
             service: Primary service name
         """
+        if start_time.tzinfo is not None:
+            # Timestamps are written as naive UTC plus "Z"; an aware start
+            # time (e.g. an unquoted "...Z" YAML value) is converted once here
+            start_time = start_time.astimezone(timezone.utc).replace(tzinfo=None)
         self.start_time = start_time
         self.service = service
         self.current_time = start_time
+        self.rng = np.random.default_rng()
         
     def generate_normal_logs(
         self,
@@ -132,27 +237,26 @@ class LogGenerator:
         """
         logs = []
         total_entries = duration_minutes * entries_per_minute
+        request_ids = self._generate_request_ids(total_entries)
+        timestamps = self._iso_timestamps(np.arange(total_entries) / entries_per_minute)
+        
+        # Bind hot lookups to locals once instead of per iteration
+        _choice, _choices, _randint = random.choice, random.choices, random.randint
+        service, hosts, info_messages = self.service, self.HOSTS, self.INFO_MESSAGES
+        # Mostly INFO, some DEBUG, rare WARN
+        levels = [LogLevel.INFO.value, LogLevel.DEBUG.value, LogLevel.WARN.value]
+        level_weights = [0.8, 0.15, 0.05]
         
         for i in range(total_entries):
-            # Calculate timestamp
-            seconds_offset = (i / entries_per_minute) * 60
-            log_time = self.start_time + timedelta(seconds=seconds_offset)
-            
-            # Mostly INFO, some DEBUG, rare WARN
-            level_choice = random.choices(
-                [LogLevel.INFO, LogLevel.DEBUG, LogLevel.WARN],
-                weights=[0.8, 0.15, 0.05]
-            )[0]
-            
             log = LogEntry(
-                timestamp=log_time.isoformat() + "Z",
-                level=level_choice.value,
-                service=self.service,
-                host=self._random_host(),
-                message=random.choice(self.INFO_MESSAGES),
-                thread_id=f"worker-{random.randint(1, 20)}",
-                request_id=self._generate_request_id(),
-                user_id=f"user-{random.randint(1000, 9999)}"
+                timestamp=timestamps[i],
+                level=_choices(levels, weights=level_weights)[0],
+                service=service,
+                host=_choice(hosts),
+                message=_choice(info_messages),
+                thread_id=f"worker-{_randint(1, 20)}",
+                request_id=request_ids[i],
+                user_id=f"user-{_randint(1000, 9999)}"
             )
             
             logs.append(log)
@@ -175,7 +279,46 @@ class LogGenerator:
         Returns:
             List of log entries showing incident progression
         """
-        logs = []
+        return self.generate_incident_log_batch(
+            incident_type, duration_minutes, severity_progression
+        ).as_entries()
+    
+    def iter_incident_logs(
+        self,
+        incident_type: str,
+        duration_minutes: int,
+        severity_progression: List[float]
+    ) -> Iterator[Dict]:
+        """Yield incident log rows as plain dicts, without building LogEntry objects
+        
+        Rows have the same keys and order as LogEntry.to_dict(), so they can
+        be serialized straight to JSONL.
+        
+        Args:
+            incident_type: Type of incident (connection, memory, timeout)
+            duration_minutes: Duration of incident
+            severity_progression: List of error rates (0.0-1.0) for each phase
+        """
+        return self.generate_incident_log_batch(
+            incident_type, duration_minutes, severity_progression
+        ).iter_rows()
+    
+    def generate_incident_log_batch(
+        self,
+        incident_type: str,
+        duration_minutes: int,
+        severity_progression: List[float]
+    ) -> LogBatch:
+        """Generate incident logs as a column-oriented LogBatch
+        
+        Args:
+            incident_type: Type of incident (connection, memory, timeout)
+            duration_minutes: Duration of incident
+            severity_progression: List of error rates (0.0-1.0) for each phase
+            
+        Returns:
+            LogBatch with one entry per generated log line
+        """
         entries_per_minute = 20  # More logs during incidents
         
         # Get relevant error messages
@@ -185,74 +328,75 @@ class LogGenerator:
         )
         
         phase_duration = duration_minutes / len(severity_progression)
+        phase_entries = int(phase_duration * entries_per_minute)
+        total = phase_entries * len(severity_progression)
         
-        for phase_idx, error_rate in enumerate(severity_progression):
-            phase_start = phase_idx * phase_duration
-            phase_end = (phase_idx + 1) * phase_duration
-            phase_entries = int(phase_duration * entries_per_minute)
-            
-            for i in range(phase_entries):
-                # Calculate timestamp
-                minutes_into_phase = (i / phase_entries) * phase_duration
-                total_minutes = phase_start + minutes_into_phase
-                log_time = self.start_time + timedelta(minutes=total_minutes)
-                
-                # Determine if this should be an error based on error_rate
-                is_error = random.random() < error_rate
-                
-                if is_error:
-                    level = random.choice([LogLevel.ERROR, LogLevel.CRITICAL])
-                    message = random.choice(error_messages)
-                    
-                    # Add stack trace for errors
-                    stack_trace = self._generate_stack_trace() if level == LogLevel.ERROR else None
-                    
-                    log = LogEntry(
-                        timestamp=log_time.isoformat() + "Z",
-                        level=level.value,
-                        service=self.service,
-                        host=self._random_host(),
-                        message=message,
-                        thread_id=f"worker-{random.randint(1, 20)}",
-                        request_id=self._generate_request_id(),
-                        stack_trace=stack_trace,
-                        metadata={
-                            "error_code": random.choice(["500", "503", "504"]),
-                            "retry_count": random.randint(0, 3)
-                        }
-                    )
-                else:
-                    # Normal log entry
-                    log = LogEntry(
-                        timestamp=log_time.isoformat() + "Z",
-                        level=LogLevel.INFO.value,
-                        service=self.service,
-                        host=self._random_host(),
-                        message=random.choice(self.INFO_MESSAGES),
-                        thread_id=f"worker-{random.randint(1, 20)}",
-                        request_id=self._generate_request_id()
-                    )
-                
-                logs.append(log)
+        # Draw every random value in vectorized batches and build each column
+        # with array indexing; nothing below loops per row in Python except
+        # the final string formatting
+        rng = self.rng
+        is_error = rng.random(total) < np.repeat(severity_progression, phase_entries)
+        err_idx = np.flatnonzero(is_error)
+        info_idx = np.flatnonzero(~is_error)
+        n_err = err_idx.size
+        worker_ids = rng.integers(1, 21, total).tolist()
+        hosts = self._HOSTS_ARR[rng.integers(0, len(self._HOSTS_ARR), total)]
         
-        return logs
-    
-    def _random_host(self) -> str:
-        """Generate random host name"""
-        prefix = random.choice(self.HOST_PREFIX)
-        number = random.randint(1, 5)
-        return f"{prefix}-{number:02d}"
+        # Error-only fields are drawn for the error rows alone and scattered
+        # into pre-filled columns, so INFO rows cost no extra RNG work
+        is_critical = rng.random(n_err) < 0.5
+        err_rows = err_idx[~is_critical]  # stack traces only on ERROR
+        levels = np.full(total, LogLevel.INFO.value, dtype=object)
+        levels[err_idx] = np.where(is_critical, LogLevel.CRITICAL.value, LogLevel.ERROR.value)
+        
+        messages = np.empty(total, dtype=object)
+        messages[err_idx] = np.asarray(error_messages)[rng.integers(0, len(error_messages), n_err)]
+        messages[info_idx] = np.asarray(self.INFO_MESSAGES)[
+            rng.integers(0, len(self.INFO_MESSAGES), info_idx.size)
+        ]
+        
+        # Metadata only on ERROR/CRITICAL
+        error_codes = np.full(total, None, dtype=object)
+        error_codes[err_idx] = np.asarray(self.ERROR_CODES)[rng.integers(0, len(self.ERROR_CODES), n_err)]
+        retry_counts = np.full(total, None, dtype=object)
+        retry_counts[err_idx] = rng.integers(0, 4, n_err).tolist()
+        stack_traces = np.full(total, None, dtype=object)
+        stack_traces[err_rows] = _STACK_TRACE
+        
+        # Minutes from start for every entry: phase start + position in phase
+        phase_starts = np.repeat(np.arange(len(severity_progression)) * phase_duration, phase_entries)
+        into_phase = np.tile((np.arange(phase_entries) / phase_entries) * phase_duration, len(severity_progression))
+        
+        return LogBatch(
+            service=self.service,
+            timestamps=self._iso_timestamps(phase_starts + into_phase),
+            levels=levels.tolist(),
+            hosts=hosts.tolist(),
+            messages=messages.tolist(),
+            thread_ids=[f"worker-{worker_id}" for worker_id in worker_ids],
+            request_ids=self._generate_request_ids(total),
+            stack_traces=stack_traces.tolist(),
+            error_codes=error_codes.tolist(),
+            retry_counts=retry_counts.tolist(),
+        )
     
-    def _generate_request_id(self) -> str:
-        """Generate unique request ID"""
-        import uuid
-        return f"req-{uuid.uuid4().hex[:12]}"
+    def _iso_timestamps(self, offsets_minutes: np.ndarray) -> List[str]:
+        """Format start_time + offsets as ISO-8601 "Z" strings in one pass
+
+        Matches datetime.isoformat(): fractional seconds only appear when
+        the microsecond part of the absolute time is non-zero.
+        """
+        offsets_us = np.rint(offsets_minutes * 60_000_000).astype('timedelta64[us]')
+        times = np.datetime64(self.start_time, 'us') + offsets_us
+        whole = (times.astype(np.int64) % 1_000_000) == 0
+        iso = np.where(
+            whole,
+            np.datetime_as_string(times, unit='s'),
+            np.datetime_as_string(times, unit='us'),
+        )
+        return [f"{ts}Z" for ts in iso.tolist()]
     
-    def _generate_stack_trace(self) -> str:
-        """Generate realistic stack trace"""
-        traces = [
-            "  at com.wardenxt.payment.PaymentService.processPayment(PaymentService.java:142)",
-            "  at com.wardenxt.api.PaymentController.handleRequest(PaymentController.java:89)",
-            "  at com.wardenxt.db.ConnectionPool.acquireConnection(ConnectionPool.java:234)"
-        ]
-        return "\n".join(traces)
\ No newline at end of file
+    def _generate_request_ids(self, count: int) -> List[str]:
+        """Generate unique request IDs from a single urandom draw"""
+        raw = os.urandom(6 * count).hex()
+        return [f"req-{raw[i:i + 12]}" for i in range(0, 12 * count, 12)]
\ No newline at end of file
@@ -3,14 +3,16 @@ Metrics Generator - Creates time-series system metrics
 Simulates CPU, memory, network, and application metrics
 """
 
-import json
-import random
-from datetime import datetime, timedelta
-from typing import List, Dict
-from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+from dataclasses import dataclass
 
+import numpy as np
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class MetricPoint:
     """Single metric data point"""
     timestamp: str
@@ -19,26 +21,82 @@ class MetricPoint:
     metrics: Dict[str, float]
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary
+
+        A plain literal rather than asdict(): metrics is a flat dict, so it is
+        shared by reference instead of deep-copied.
+        """
+        return {
+            "timestamp": self.timestamp,
+            "service": self.service,
+            "host": self.host,
+            "metrics": self.metrics
+        }
     
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 JSON bytes (orjson serializes dataclasses natively)"""
+        return orjson.dumps(self)
+
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
+
+
+def write_ndjson(path: Path, points: Iterable[MetricPoint]) -> int:
+    """Write metric points as NDJSON, one line per point, as they arrive
+
+    Accepts any iterable, so iter_*_metrics() output is never held in full.
+
+    Returns:
+        Number of points written
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        for point in points:
+            f.write(point.to_json_bytes() + b'\n')
+            count += 1
+    return count
 
 
 class MetricsGenerator:
     """Generates realistic system and application metrics"""
     
-    def __init__(self, start_time: datetime, service: str = "payment-api"):
+    # Hosts that serve the application tier
+    HOSTS = ("prod-app-01", "prod-app-02", "prod-app-03")
+    # Object array so gathered hosts are the same shared str objects
+    _HOSTS_ARR = np.array(HOSTS, dtype=object)
+    
+    # Decimal places of the float32 columns in generate_normal_metrics_soa;
+    # float32 holds ~7 significant digits, enough for every value here
+    _NORMAL_DECIMALS = {
+        "cpu_percent": 2,
+        "memory_mb": 2,
+        "requests_per_sec": 2,
+        "error_rate": 4,
+        "latency_p50_ms": 2,
+        "latency_p95_ms": 2,
+        "latency_p99_ms": 2
+    }
+    
+    def __init__(
+        self,
+        start_time: datetime,
+        service: str = "payment-api",
+        seed: Optional[int] = None
+    ):
         """Initialize metrics generator
         
         Args:
             start_time: When to start generating metrics
             service: Service name
+            seed: Seed for the random generator, for reproducible output
         """
+        if start_time.tzinfo is not None:
+            # datetime64 has no timezone; work in naive UTC like the "Z" output
+            start_time = start_time.astimezone(timezone.utc).replace(tzinfo=None)
         self.start_time = start_time
         self.service = service
+        self.rng = np.random.default_rng(seed)
         
     def generate_normal_metrics(
         self,
@@ -54,7 +112,56 @@ class MetricsGenerator:
         Returns:
             List of metric points
         """
-        metrics = []
+        return list(self.iter_normal_metrics(duration_minutes, interval_seconds))
+    
+    def iter_normal_metrics(
+        self,
+        duration_minutes: int,
+        interval_seconds: int = 60
+    ) -> Iterator[MetricPoint]:
+        """Stream normal operation metrics without building the full list
+        
+        Args:
+            duration_minutes: How long to generate metrics for
+            interval_seconds: Time between metric points
+            
+        Yields:
+            Metric points in time order
+        """
+        columns = self.generate_normal_metrics_soa(duration_minutes, interval_seconds)
+        timestamps = self._iso_timestamps(columns.pop("timestamp"))
+        hosts = columns.pop("host").tolist()
+        names = tuple(columns)
+        # Widen float32 columns and re-round so JSON keeps the short decimals
+        rows = zip(*(
+            np.round(column.astype(np.float64), self._NORMAL_DECIMALS[name]).tolist()
+            if column.dtype == np.float32 else column.tolist()
+            for name, column in columns.items()
+        ))
+        
+        service = self.service
+        for timestamp, host, row in zip(timestamps, hosts, rows):
+            yield MetricPoint(timestamp=timestamp, service=service, host=host, metrics=dict(zip(names, row)))
+    
+    def generate_normal_metrics_soa(
+        self,
+        duration_minutes: int,
+        interval_seconds: int = 60
+    ) -> Dict[str, np.ndarray]:
+        """Generate normal operation metrics as columns (structure of arrays)
+        
+        Column scans such as "max cpu_percent over a window" become a single
+        NumPy reduction instead of a dict lookup per point.
+        
+        Args:
+            duration_minutes: How long to generate metrics for
+            interval_seconds: Time between metric points
+            
+        Returns:
+            Dict of equal-length arrays: "timestamp" (datetime64), "host",
+            then one array per metric name. Rounded metrics are stored as
+            float32 and connection counts as int16.
+        """
         num_points = int((duration_minutes * 60) / interval_seconds)
         
         # Baseline values for normal operation
@@ -63,36 +170,37 @@ class MetricsGenerator:
         base_requests = 150  # 150 req/sec
         base_latency = 45  # 45ms p99
         
-        for i in range(num_points):
-            timestamp = self.start_time + timedelta(seconds=i * interval_seconds)
-            
-            # Add natural variation
-            cpu = base_cpu + random.uniform(-5, 5)
-            memory = base_memory + random.uniform(-100, 100)
-            requests = base_requests + random.uniform(-20, 20)
-            latency = base_latency + random.uniform(-10, 15)
-            error_rate = random.uniform(0, 0.005)  # 0-0.5% errors
-            
-            metric = MetricPoint(
-                timestamp=timestamp.isoformat() + "Z",
-                service=self.service,
-                host=f"prod-app-{random.randint(1, 3):02d}",
-                metrics={
-                    "cpu_percent": round(cpu, 2),
-                    "memory_mb": round(memory, 2),
-                    "requests_per_sec": round(requests, 2),
-                    "error_rate": round(error_rate, 4),
-                    "latency_p50_ms": round(latency * 0.6, 2),
-                    "latency_p95_ms": round(latency * 0.9, 2),
-                    "latency_p99_ms": round(latency, 2),
-                    "active_connections": random.randint(45, 55),
-                    "connection_pool_usage": random.uniform(0.4, 0.6)
-                }
-            )
-            
-            metrics.append(metric)
-            
-        return metrics
+        # Add natural variation, drawing each field for all points at once.
+        # The 2-decimal columns are rows of one matrix so a single np.round
+        # pass and a single float32 cast cover all of them.
+        rng = self.rng
+        two_dp = np.empty((6, num_points))
+        two_dp[0] = base_cpu + rng.uniform(-5, 5, num_points)
+        two_dp[1] = base_memory + rng.uniform(-100, 100, num_points)
+        two_dp[2] = base_requests + rng.uniform(-20, 20, num_points)
+        two_dp[5] = base_latency + rng.uniform(-10, 15, num_points)  # p99
+        np.multiply(two_dp[5], 0.6, out=two_dp[3])  # p50
+        np.multiply(two_dp[5], 0.9, out=two_dp[4])  # p95
+        np.round(two_dp, 2, out=two_dp)
+        cpu, memory, requests, p50, p95, p99 = two_dp.astype(np.float32)
+        
+        # 0-0.5% errors, kept to 4 decimals
+        error_rate = rng.uniform(0, 0.005, num_points)
+        np.round(error_rate, 4, out=error_rate)
+        
+        return {
+            "timestamp": self._timestamps(num_points, interval_seconds),
+            "host": self._pick_hosts(num_points),
+            "cpu_percent": cpu,
+            "memory_mb": memory,
+            "requests_per_sec": requests,
+            "error_rate": error_rate.astype(np.float32),
+            "latency_p50_ms": p50,
+            "latency_p95_ms": p95,
+            "latency_p99_ms": p99,
+            "active_connections": rng.integers(45, 56, num_points, dtype=np.int16),
+            "connection_pool_usage": rng.uniform(0.4, 0.6, num_points)
+        }
     
     def generate_incident_metrics(
         self,
@@ -112,153 +220,206 @@ class MetricsGenerator:
         Returns:
             List of metric points showing incident
         """
-        metrics = []
+        return list(self.iter_incident_metrics(incident_type, duration_minutes, phases, interval_seconds))
+    
+    def iter_incident_metrics(
+        self,
+        incident_type: str,
+        duration_minutes: int,
+        phases: Sequence[Mapping[str, float]],
+        interval_seconds: int = 60
+    ) -> Iterator[MetricPoint]:
+        """Stream incident metrics one phase at a time
+        
+        Only the current phase's rows are materialized as dicts.
+        
+        Args:
+            incident_type: Type of incident (connection, memory, cpu)
+            duration_minutes: Duration of incident
+            phases: List of metric adjustments per phase
+            interval_seconds: Time between points
+            
+        Yields:
+            Metric points in time order
+        """
         num_points = int((duration_minutes * 60) / interval_seconds)
         points_per_phase = num_points // len(phases)
         
+        # Pick the per-phase kernel once rather than per point
+        if incident_type == "connection_pool":
+            kernel = self._connection_pool_metrics
+        elif incident_type == "memory_leak":
+            kernel = self._memory_leak_metrics
+        elif incident_type == "cpu_spike":
+            kernel = self._cpu_spike_metrics
+        elif incident_type == "bmr_recovery":
+            kernel = self._bmr_recovery_metrics
+        else:
+            kernel = self._generic_degradation_metrics
+        
+        hosts = self._pick_hosts(num_points).tolist()
+        timestamps = self._iso_timestamps(self._timestamps(num_points, interval_seconds))
+        service = self.service
+        
+        # Each kernel fills whole columns for a phase; rows are assembled
+        # into dicts only as the phase is yielded
         for phase_idx, phase_config in enumerate(phases):
             phase_start = phase_idx * points_per_phase
             phase_end = (phase_idx + 1) * points_per_phase if phase_idx < len(phases) - 1 else num_points
+            if phase_end <= phase_start:
+                continue
             
-            for i in range(phase_start, phase_end):
-                timestamp = self.start_time + timedelta(seconds=i * interval_seconds)
-                
-                # Interpolate within phase
-                phase_progress = (i - phase_start) / (phase_end - phase_start)
-                
-                # Build metrics based on incident type and phase
-                if incident_type == "connection_pool":
-                    metrics_data = self._connection_pool_metrics(phase_config, phase_progress)
-                elif incident_type == "memory_leak":
-                    metrics_data = self._memory_leak_metrics(phase_config, phase_progress)
-                elif incident_type == "cpu_spike":
-                    metrics_data = self._cpu_spike_metrics(phase_config, phase_progress)
-                elif incident_type == "bmr_recovery":
-                    metrics_data = self._bmr_recovery_metrics(phase_config, phase_progress)
-                else:
-                    metrics_data = self._generic_degradation_metrics(phase_config, phase_progress)
-                
-                metric = MetricPoint(
-                    timestamp=timestamp.isoformat() + "Z",
-                    service=self.service,
-                    host=f"prod-app-{random.randint(1, 3):02d}",
-                    metrics=metrics_data
-                )
-                
-                metrics.append(metric)
-        
-        return metrics
+            # Interpolate within phase
+            phase_progress = np.arange(phase_end - phase_start) / (phase_end - phase_start)
+            columns = kernel(phase_config, phase_progress)
+            names = tuple(columns)
+            for timestamp, host, row in zip(
+                timestamps[phase_start:phase_end],
+                hosts[phase_start:phase_end],
+                zip(*columns.values())
+            ):
+                yield MetricPoint(timestamp=timestamp, service=service, host=host, metrics=dict(zip(names, row)))
+    
+    def _pick_hosts(self, num_points: int) -> np.ndarray:
+        """Assign a host to each of num_points points in one draw"""
+        return self._HOSTS_ARR[self.rng.integers(0, len(self._HOSTS_ARR), num_points, dtype=np.int8)]
+    
+    def _timestamps(self, num_points: int, interval_seconds: int) -> np.ndarray:
+        """start_time plus each fixed interval, as a datetime64[us] array"""
+        return np.datetime64(self.start_time, 'us') + np.arange(num_points) * np.timedelta64(interval_seconds, 's')
+    
+    def _iso_timestamps(self, times: np.ndarray) -> List[str]:
+        """Format timestamps as ISO-8601 "Z" strings in one pass
+
+        Matches datetime.isoformat(): fractional seconds only appear when
+        start_time has a non-zero microsecond part.
+        """
+        unit = 'us' if self.start_time.microsecond else 's'
+        return [f"{ts}Z" for ts in np.datetime_as_string(times, unit=unit).tolist()]
     
     def _connection_pool_metrics(
         self,
-        config: Dict[str, float],
-        progress: float
-    ) -> Dict[str, float]:
-        """Metrics for connection pool exhaustion"""
+        config: Mapping[str, float],
+        progress: np.ndarray
+    ) -> Dict[str, list]:
+        """Metrics for connection pool exhaustion, one column per metric"""
+        n = len(progress)
+        rng = self.rng
         base_connections = config.get("active_connections", 50)
         max_connections = config.get("max_connections", 100)
         pool_usage = config.get("pool_usage", 0.5)
+        latency = config.get("latency", 200)
         
         # Connection pool fills up
         connections = int(base_connections + (max_connections - base_connections) * pool_usage)
         
         return {
-            "cpu_percent": round(config.get("cpu", 30) + random.uniform(-3, 3), 2),
-            "memory_mb": round(config.get("memory", 1800) + random.uniform(-50, 50), 2),
-            "requests_per_sec": round(config.get("requests", 120) + random.uniform(-10, 10), 2),
-            "error_rate": round(config.get("error_rate", 0.05), 4),
-            "latency_p50_ms": round(config.get("latency", 200) * 0.6, 2),
-            "latency_p95_ms": round(config.get("latency", 200) * 0.9, 2),
-            "latency_p99_ms": round(config.get("latency", 200), 2),
-            "active_connections": connections,
-            "connection_pool_usage": round(connections / max_connections, 3)
+            "cpu_percent": np.round(config.get("cpu", 30) + rng.uniform(-3, 3, n), 2).tolist(),
+            "memory_mb": np.round(config.get("memory", 1800) + rng.uniform(-50, 50, n), 2).tolist(),
+            "requests_per_sec": np.round(config.get("requests", 120) + rng.uniform(-10, 10, n), 2).tolist(),
+            "error_rate": [round(config.get("error_rate", 0.05), 4)] * n,
+            "latency_p50_ms": [round(latency * 0.6, 2)] * n,
+            "latency_p95_ms": [round(latency * 0.9, 2)] * n,
+            "latency_p99_ms": [round(latency, 2)] * n,
+            "active_connections": [connections] * n,
+            "connection_pool_usage": [round(connections / max_connections, 3)] * n
         }
     
     def _memory_leak_metrics(
         self,
-        config: Dict[str, float],
-        progress: float
-    ) -> Dict[str, float]:
-        """Metrics for memory leak"""
+        config: Mapping[str, float],
+        progress: np.ndarray
+    ) -> Dict[str, list]:
+        """Metrics for memory leak, one column per metric"""
+        n = len(progress)
+        rng = self.rng
         base_memory = config.get("memory_base", 1200)
         memory_growth = config.get("memory_growth", 1000)
+        latency = config.get("latency", 150)
         
         # Memory grows linearly
         memory = base_memory + (memory_growth * progress)
         
         return {
-            "cpu_percent": round(config.get("cpu", 35) + random.uniform(-5, 5), 2),
-            "memory_mb": round(memory + random.uniform(-30, 30), 2),
-            "requests_per_sec": round(config.get("requests", 100) + random.uniform(-15, 15), 2),
-            "error_rate": round(config.get("error_rate", 0.03), 4),
-            "latency_p50_ms": round(config.get("latency", 150) * 0.6, 2),
-            "latency_p95_ms": round(config.get("latency", 150) * 0.9, 2),
-            "latency_p99_ms": round(config.get("latency", 150), 2),
-            "gc_count": int(20 + progress * 30),  # GC activity increases
-            "gc_pause_ms": round(50 + progress * 200, 2)
+            "cpu_percent": np.round(config.get("cpu", 35) + rng.uniform(-5, 5, n), 2).tolist(),
+            "memory_mb": np.round(memory + rng.uniform(-30, 30, n), 2).tolist(),
+            "requests_per_sec": np.round(config.get("requests", 100) + rng.uniform(-15, 15, n), 2).tolist(),
+            "error_rate": [round(config.get("error_rate", 0.03), 4)] * n,
+            "latency_p50_ms": [round(latency * 0.6, 2)] * n,
+            "latency_p95_ms": [round(latency * 0.9, 2)] * n,
+            "latency_p99_ms": [round(latency, 2)] * n,
+            "gc_count": (20 + progress * 30).astype(np.int64).tolist(),  # GC activity increases
+            "gc_pause_ms": np.round(50 + progress * 200, 2).tolist()
         }
     
     def _cpu_spike_metrics(
         self,
-        config: Dict[str, float],
-        progress: float
-    ) -> Dict[str, float]:
-        """Metrics for CPU spike"""
+        config: Mapping[str, float],
+        progress: np.ndarray
+    ) -> Dict[str, list]:
+        """Metrics for CPU spike, one column per metric"""
+        n = len(progress)
+        rng = self.rng
+        latency = config.get("latency", 300)
         return {
-            "cpu_percent": round(config.get("cpu", 80) + random.uniform(-5, 10), 2),
-            "memory_mb": round(config.get("memory", 1500) + random.uniform(-50, 50), 2),
-            "requests_per_sec": round(config.get("requests", 80) + random.uniform(-10, 10), 2),
-            "error_rate": round(config.get("error_rate", 0.02), 4),
-            "latency_p50_ms": round(config.get("latency", 300) * 0.6, 2),
-            "latency_p95_ms": round(config.get("latency", 300) * 0.9, 2),
-            "latency_p99_ms": round(config.get("latency", 300), 2),
-            "thread_count": int(config.get("threads", 100)),
-            "queue_depth": int(config.get("queue", 50))
+            "cpu_percent": np.round(config.get("cpu", 80) + rng.uniform(-5, 10, n), 2).tolist(),
+            "memory_mb": np.round(config.get("memory", 1500) + rng.uniform(-50, 50, n), 2).tolist(),
+            "requests_per_sec": np.round(config.get("requests", 80) + rng.uniform(-10, 10, n), 2).tolist(),
+            "error_rate": [round(config.get("error_rate", 0.02), 4)] * n,
+            "latency_p50_ms": [round(latency * 0.6, 2)] * n,
+            "latency_p95_ms": [round(latency * 0.9, 2)] * n,
+            "latency_p99_ms": [round(latency, 2)] * n,
+            "thread_count": [int(config.get("threads", 100))] * n,
+            "queue_depth": [int(config.get("queue", 50))] * n
         }
     
     def _bmr_recovery_metrics(
         self,
-        config: Dict[str, float],
-        progress: float
-    ) -> Dict[str, float]:
-        """Metrics for BMR (Bare Metal Recovery)"""
+        config: Mapping[str, float],
+        progress: np.ndarray
+    ) -> Dict[str, list]:
+        """Metrics for BMR (Bare Metal Recovery), one column per metric"""
+        n = len(progress)
         # During recovery, service is down or degraded
         is_recovering = config.get("recovering", False)
         
         if not is_recovering:
             # Service is down
             return {
-                "cpu_percent": 0.0,
-                "memory_mb": 0.0,
-                "requests_per_sec": 0.0,
-                "error_rate": 1.0,  # 100% errors
-                "latency_p99_ms": 0.0,
-                "service_available": False
+                "cpu_percent": [0.0] * n,
+                "memory_mb": [0.0] * n,
+                "requests_per_sec": [0.0] * n,
+                "error_rate": [1.0] * n,  # 100% errors
+                "latency_p99_ms": [0.0] * n,
+                "service_available": [False] * n
             }
         else:
             # Service is coming back online
             recovery_progress = progress
             return {
-                "cpu_percent": round(10 + recovery_progress * 20, 2),
-                "memory_mb": round(500 + recovery_progress * 700, 2),
-                "requests_per_sec": round(recovery_progress * 150, 2),
-                "error_rate": round((1 - recovery_progress) * 0.5, 4),
-                "latency_p99_ms": round(1000 - recovery_progress * 900, 2),
-                "service_available": recovery_progress > 0.8
+                "cpu_percent": np.round(10 + recovery_progress * 20, 2).tolist(),
+                "memory_mb": np.round(500 + recovery_progress * 700, 2).tolist(),
+                "requests_per_sec": np.round(recovery_progress * 150, 2).tolist(),
+                "error_rate": np.round((1 - recovery_progress) * 0.5, 4).tolist(),
+                "latency_p99_ms": np.round(1000 - recovery_progress * 900, 2).tolist(),
+                "service_available": (recovery_progress > 0.8).tolist()
             }
     
     def _generic_degradation_metrics(
         self,
-        config: Dict[str, float],
-        progress: float
-    ) -> Dict[str, float]:
-        """Generic degraded performance metrics"""
+        config: Mapping[str, float],
+        progress: np.ndarray
+    ) -> Dict[str, list]:
+        """Generic degraded performance metrics, one column per metric"""
+        n = len(progress)
+        rng = self.rng
+        latency = config.get("latency", 250)
         return {
-            "cpu_percent": round(config.get("cpu", 50) + random.uniform(-5, 5), 2),
-            "memory_mb": round(config.get("memory", 1600) + random.uniform(-50, 50), 2),
-            "requests_per_sec": round(config.get("requests", 100) + random.uniform(-10, 10), 2),
-            "error_rate": round(config.get("error_rate", 0.08), 4),
-            "latency_p50_ms": round(config.get("latency", 250) * 0.6, 2),
-            "latency_p95_ms": round(config.get("latency", 250) * 0.9, 2),
-            "latency_p99_ms": round(config.get("latency", 250), 2)
-        }
\ No newline at end of file
+            "cpu_percent": np.round(config.get("cpu", 50) + rng.uniform(-5, 5, n), 2).tolist(),
+            "memory_mb": np.round(config.get("memory", 1600) + rng.uniform(-50, 50, n), 2).tolist(),
+            "requests_per_sec": np.round(config.get("requests", 100) + rng.uniform(-10, 10, n), 2).tolist(),
+            "error_rate": [round(config.get("error_rate", 0.08), 4)] * n,
+            "latency_p50_ms": [round(latency * 0.6, 2)] * n,
+            "latency_p95_ms": [round(latency * 0.9, 2)] * n,
+            "latency_p99_ms": [round(latency, 2)] * n
+        }
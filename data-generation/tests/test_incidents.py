@@ -0,0 +1,19 @@
+"""
+Incident Generator Tests
+"""
+
+import gzip
+
+from generators.incidents import _write_jsonl
+
+
+def test_write_jsonl_compressed_round_trip(tmp_path):
+    """Test compressed JSONL is written as .gz and reads back line for line"""
+    lines = [b'{"n":%d}' % i for i in range(25)]
+
+    count = _write_jsonl(tmp_path / "logs.jsonl", iter(lines), compress=True)
+
+    assert count == 25
+    assert not (tmp_path / "logs.jsonl").exists()
+    with gzip.open(tmp_path / "logs.jsonl.gz", "rb") as f:
+        assert f.read().splitlines() == lines
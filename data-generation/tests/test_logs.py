@@ -0,0 +1,67 @@
+"""
+Log Generator Tests
+"""
+
+from datetime import datetime, timedelta
+
+from generators.logs import LogGenerator
+
+
+def test_incident_timestamps_keep_start_time_microseconds():
+    """Test sub-second start times survive vectorized timestamp formatting"""
+    start = datetime(2026, 1, 1, 0, 0, 0, 123456)
+    batch = LogGenerator(start).generate_incident_log_batch("connection", 6, [0.0, 0.5])
+
+    phase_duration = 3
+    expected = [
+        (start + timedelta(minutes=phase * phase_duration + i * phase_duration / 60)).isoformat() + "Z"
+        for phase in range(2)
+        for i in range(60)
+    ]
+    assert batch.timestamps == expected
+    assert batch.timestamps[0] == "2026-01-01T00:00:00.123456Z"
+
+
+def test_incident_timestamps_whole_seconds():
+    """Test whole-second times carry no fractional part"""
+    batch = LogGenerator(datetime(2026, 1, 1)).generate_incident_log_batch("memory", 6, [0.1, 0.2])
+
+    assert batch.timestamps[0] == "2026-01-01T00:00:00Z"
+    assert batch.timestamps[1] == "2026-01-01T00:00:03Z"
+
+
+def test_aware_start_time_normalized_to_utc():
+    """Test a tz-aware start time is converted to UTC without NumPy warnings"""
+    import warnings
+    from datetime import timezone
+
+    start = datetime(2026, 1, 1, 2, 0, tzinfo=timezone(timedelta(hours=2)))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        batch = LogGenerator(start).generate_incident_log_batch("memory", 6, [0.1, 0.2])
+
+    assert batch.timestamps[0] == "2026-01-01T00:00:00Z"
+    assert batch.timestamps[1] == "2026-01-01T00:00:03Z"
+
+
+def test_log_batch_rows_match_log_entry_dicts():
+    """Test LogBatch rows have LogEntry.to_dict() keys, order and metadata"""
+    from generators.logs import LogEntry
+
+    batch = LogGenerator(datetime(2026, 1, 1)).generate_incident_log_batch("connection", 12, [0.0, 0.5, 1.0])
+    rows = list(batch.iter_rows())
+    entries = batch.as_entries()
+
+    assert len(rows) == len(batch) == 240
+    assert rows == [entry.to_dict() for entry in entries]
+    for row, entry in zip(rows, entries):
+        assert list(row) == list(entry.to_dict())
+        assert entry.to_json_fast() == entry.to_json_bytes()
+        if row["level"] == "INFO":
+            assert "metadata" not in row and "stack_trace" not in row
+        else:
+            assert row["metadata"]["error_code"] in LogGenerator.ERROR_CODES
+            assert type(row["metadata"]["retry_count"]) is int
+            assert list(row["metadata"]) == ["error_code", "retry_count"]
+            assert ("stack_trace" in row) == (row["level"] == "ERROR")
+    assert {row["level"] for row in rows} == {"INFO", "ERROR", "CRITICAL"}
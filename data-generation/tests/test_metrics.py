@@ -0,0 +1,59 @@
+"""
+Metrics Generator Tests
+"""
+
+import warnings
+from datetime import datetime, timedelta, timezone
+
+from generators.metrics import MetricsGenerator
+
+
+def test_aware_start_time_normalized_to_utc():
+    """Test a tz-aware start time is converted to UTC without NumPy warnings"""
+    start = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        points = MetricsGenerator(start, seed=1).generate_normal_metrics(3)
+
+    assert [point.timestamp for point in points] == [
+        "2026-01-01T00:00:00Z", "2026-01-01T00:01:00Z", "2026-01-01T00:02:00Z",
+    ]
+
+
+def test_normal_metrics_soa_dtypes():
+    """Test the columnar metrics use compact dtypes"""
+    columns = MetricsGenerator(datetime(2026, 1, 1), seed=7).generate_normal_metrics_soa(30)
+
+    assert {name: column.dtype.str[1:] for name, column in columns.items()} == {
+        "timestamp": "M8[us]",
+        "host": "O",
+        "cpu_percent": "f4",
+        "memory_mb": "f4",
+        "requests_per_sec": "f4",
+        "error_rate": "f4",
+        "latency_p50_ms": "f4",
+        "latency_p95_ms": "f4",
+        "latency_p99_ms": "f4",
+        "active_connections": "i2",
+        "connection_pool_usage": "f8",
+    }
+    assert {len(column) for column in columns.values()} == {30}
+
+
+def test_normal_metrics_json_keeps_short_decimals():
+    """Test float32 columns widen back to 2- and 4-decimal JSON values"""
+    import orjson
+
+    columns = MetricsGenerator(datetime(2026, 1, 1), seed=7).generate_normal_metrics_soa(30)
+    points = list(MetricsGenerator(datetime(2026, 1, 1), seed=7).iter_normal_metrics(30))
+
+    assert len(points) == 30
+    for i, point in enumerate(points):
+        metrics = orjson.loads(point.to_json_bytes())["metrics"]
+        for name, decimals in MetricsGenerator._NORMAL_DECIMALS.items():
+            value = metrics[name]
+            assert type(value) is float
+            assert len(repr(value).partition(".")[2]) <= decimals, (name, value)
+            assert abs(value - float(columns[name][i])) < 10 ** -decimals
+        assert type(metrics["active_connections"]) is int
+        assert 45 <= metrics["active_connections"] <= 55
@@ -3,10 +3,12 @@ Migration Script: Add Missing Fields to summary.json Files
 Enriches existing incident summaries with fields needed by frontend
 """
 
-import json
+import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import orjson
+
 # Mapping of incident IDs to their types
 INCIDENT_TYPES = {
     "INC-2026-0001": "bmr_recovery",
@@ -16,14 +18,30 @@ INCIDENT_TYPES = {
     "INC-2026-0005": "kubernetes_crashloop"
 }
 
-def migrate_summary(summary_path: Path, incident_id: str):
-    """Migrate a single summary.json file"""
+# Fields added by the migration; a summary with all of them is left alone
+MIGRATED_FIELDS = frozenset({
+    'incident_type', 'start_time', 'end_time', 'detection_time',
+    'resolution_time', 'business_impact', 'mttr_actual', 'mttr_target'
+})
+
+
+def _iso(dt: datetime) -> str:
+    """Format as YYYY-MM-DDTHH:MM:SSZ without strftime's locale machinery"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+
+
+def migrate_summary(summary_path: Path, incident_id: str) -> bool:
+    """Migrate a single summary.json file, returning False if already migrated"""
     
     print(f"Migrating {incident_id}...")
     
     # Load existing summary
-    with open(summary_path, 'r') as f:
-        data = json.load(f)
+    data = orjson.loads(summary_path.read_bytes())
+    
+    # Already migrated: skip the backup and rewrite
+    if MIGRATED_FIELDS.issubset(data):
+        print(f"✓ {incident_id} already migrated, skipping")
+        return False
     
     # Add incident_type if missing
     if 'incident_type' not in data:
@@ -35,22 +53,22 @@ def migrate_summary(summary_path: Path, incident_id: str):
     if 'start_time' not in data:
         # Use a realistic timestamp (2 days ago at 2 AM)
         start_time = datetime.now() - timedelta(days=2, hours=-2)
-        data['start_time'] = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+        data['start_time'] = _iso(start_time)
     else:
         start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
     
     if 'end_time' not in data:
         end_time = start_time + timedelta(minutes=duration_minutes)
-        data['end_time'] = end_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+        data['end_time'] = _iso(end_time)
     
     if 'detection_time' not in data:
         # Detection 2 minutes after start
         detection_time = start_time + timedelta(minutes=2)
-        data['detection_time'] = detection_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+        data['detection_time'] = _iso(detection_time)
     
     if 'resolution_time' not in data:
         resolution_time = start_time + timedelta(minutes=duration_minutes)
-        data['resolution_time'] = resolution_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+        data['resolution_time'] = _iso(resolution_time)
     
     # Add business impact if missing
     if 'business_impact' not in data:
@@ -77,21 +95,19 @@ def migrate_summary(summary_path: Path, incident_id: str):
         mins = target_minutes % 60
         data['mttr_target'] = f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
     
-    # Backup original file
+    # Backup original file (raw byte copy, no re-parse)
     backup_path = summary_path.parent / 'summary.json.bak'
-    with open(summary_path, 'r') as f:
-        backup_data = json.load(f)
-    with open(backup_path, 'w') as f:
-        json.dump(backup_data, f, indent=2)
+    shutil.copyfile(summary_path, backup_path)
     
     # Write migrated summary
-    with open(summary_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(summary_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     print(f"✓ Migrated {incident_id}")
     print(f"  - Added incident_type: {data['incident_type']}")
     print(f"  - Added timestamps: {data['start_time']} to {data['end_time']}")
     print(f"  - Backup saved to: summary.json.bak")
+    return True
 
 
 def main():
@@ -138,8 +154,10 @@ def main():
     
     print(f"Found {len(incident_dirs)} incidents to migrate\n")
     
-    # Migrate each incident
+    # Migrate each incident; a handful of small files is faster serially
+    # than the cost of starting a worker pool
     success_count = 0
+    skipped_count = 0
     error_count = 0
     
     for incident_dir in sorted(incident_dirs):
@@ -147,8 +165,10 @@ def main():
         summary_path = incident_dir / 'summary.json'
         
         try:
-            migrate_summary(summary_path, incident_id)
-            success_count += 1
+            if migrate_summary(summary_path, incident_id):
+                success_count += 1
+            else:
+                skipped_count += 1
             print()  # Empty line for readability
         except Exception as e:
             print(f"✗ Error migrating {incident_id}: {e}")
@@ -158,6 +178,8 @@ def main():
     print("=" * 60)
     print(f"Migration complete!")
     print(f"  ✓ Successfully migrated: {success_count}")
+    if skipped_count > 0:
+        print(f"  - Already migrated (skipped): {skipped_count}")
     if error_count > 0:
         print(f"  ✗ Errors: {error_count}")
     
@@ -2,17 +2,28 @@
 """
 Test script to verify all security fixes
 """
-import requests
+import asyncio
+import httpx
 import json
 import sys
 
 BASE_URL = "http://localhost:8000"
 
-def test_health():
+
+def _transport_failed(response) -> bool:
+    """Report a request that raised instead of returning a response"""
+    if isinstance(response, Exception):
+        print(f"   [X] FAIL: {response}")
+        return True
+    return False
+
+
+def check_health(response):
     """Test health endpoint (unauthenticated)"""
     print("\n1. Testing health endpoint (should work without auth)...")
+    if _transport_failed(response):
+        return False
     try:
-        response = requests.get(f"{BASE_URL}/health")
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
             print(f"   Response: {response.json()}")
@@ -26,11 +37,12 @@ def test_health():
         return False
 
 
-def test_incidents_without_auth():
+def check_incidents_without_auth(response):
     """Test that incidents endpoint requires authentication"""
     print("\n2. Testing incidents endpoint WITHOUT auth (should fail)...")
+    if _transport_failed(response):
+        return False
     try:
-        response = requests.get(f"{BASE_URL}/api/incidents/")
         print(f"   Status: {response.status_code}")
         if response.status_code == 401 or response.status_code == 403:
             print(f"   Response: {response.json()}")
@@ -45,14 +57,12 @@ def test_incidents_without_auth():
         return False
 
 
-def test_login():
+def check_login(response):
     """Test login endpoint"""
     print("\n3. Testing login endpoint...")
+    if _transport_failed(response):
+        return None
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/auth/login",
-            json={"username": "admin", "password": "admin123"}
-        )
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
@@ -69,12 +79,12 @@ def test_login():
         return None
 
 
-def test_incidents_with_auth(token):
+def check_incidents_with_auth(response):
     """Test incidents endpoint with authentication"""
     print("\n4. Testing incidents endpoint WITH auth (should work)...")
+    if _transport_failed(response):
+        return []
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(f"{BASE_URL}/api/incidents/", headers=headers)
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
@@ -91,15 +101,12 @@ def test_incidents_with_auth(token):
         return []
 
 
-def test_incident_detail_with_auth(token, incident_id):
+def check_incident_detail_with_auth(response, incident_id):
     """Test incident detail endpoint with authentication"""
     print(f"\n5. Testing incident detail endpoint for {incident_id}...")
+    if _transport_failed(response):
+        return False
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            f"{BASE_URL}/api/incidents/{incident_id}",
-            headers=headers
-        )
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
@@ -115,90 +122,93 @@ def test_incident_detail_with_auth(token, incident_id):
         return False
 
 
-def test_path_traversal(token):
+def check_path_traversal(response):
     """Test that path traversal is blocked"""
     print("\n6. Testing path traversal protection...")
-    try:
-        headers = {"Authorization": f"Bearer {token}"}
-        # Try to access parent directory
-        response = requests.get(
-            f"{BASE_URL}/api/incidents/../../../etc/passwd",
-            headers=headers
-        )
-        print(f"   Status: {response.status_code}")
-        if response.status_code == 404 or response.status_code == 400:
-            print("   [OK] PASS - Path traversal blocked")
-            return True
-        else:
-            print(f"   [X] FAIL: Path traversal not properly blocked")
-            return False
-    except Exception as e:
-        print(f"   [X] FAIL: {e}")
+    if _transport_failed(response):
+        return False
+    print(f"   Status: {response.status_code}")
+    if response.status_code == 404 or response.status_code == 400:
+        print("   [OK] PASS - Path traversal blocked")
+        return True
+    else:
+        print(f"   [X] FAIL: Path traversal not properly blocked")
         return False
 
 
-def test_status_endpoint_auth(token):
+def check_status_endpoint_auth(without_auth, with_auth):
     """Test that status endpoints require authentication"""
     print("\n7. Testing status endpoint authentication...")
-    try:
-        # Try without auth first
-        response = requests.get(f"{BASE_URL}/api/status/INC-2024-001")
-        print(f"   Without auth - Status: {response.status_code}")
+    if _transport_failed(without_auth) or _transport_failed(with_auth):
+        return False
+    print(f"   Without auth - Status: {without_auth.status_code}")
 
-        if response.status_code in [401, 403]:
-            print("   [OK] No auth rejected")
+    if without_auth.status_code in [401, 403]:
+        print("   [OK] No auth rejected")
+        print(f"   With auth - Status: {with_auth.status_code}")
 
-            # Now try with auth
-            headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get(
-                f"{BASE_URL}/api/status/INC-2024-001",
-                headers=headers
-            )
-            print(f"   With auth - Status: {response.status_code}")
+        if with_auth.status_code in [200, 404]:
+            print("   [OK] PASS - Status endpoint authentication working")
+            return True
 
-            if response.status_code in [200, 404]:
-                print("   [OK] PASS - Status endpoint authentication working")
-                return True
-
-        print(f"   [X] FAIL: Status endpoint authentication not working")
-        return False
-    except Exception as e:
-        print(f"   [X] FAIL: {e}")
-        return False
+    print(f"   [X] FAIL: Status endpoint authentication not working")
+    return False
 
 
-def main():
+async def main():
     print("=" * 60)
     print("WardenXT Security Fixes - Test Suite")
     print("=" * 60)
 
     results = []
 
-    # Test 1: Health check
-    results.append(("Health Check", test_health()))
+    # Requests that don't depend on each other are sent concurrently; the
+    # checks then report on the responses in order
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        # Tests 1-3: Health check, auth required, login
+        health, no_auth, login = await asyncio.gather(
+            client.get("/health"),
+            client.get("/api/incidents/"),
+            client.post("/api/auth/login", json={"username": "admin", "password": "admin123"}),
+            return_exceptions=True
+        )
+        results.append(("Health Check", check_health(health)))
+        results.append(("Auth Required", check_incidents_without_auth(no_auth)))
+
+        token = check_login(login)
+        results.append(("Login", token is not None))
 
-    # Test 2: Authentication required
-    results.append(("Auth Required", test_incidents_without_auth()))
+        if token:
+            headers = {"Authorization": f"Bearer {token}"}
 
-    # Test 3: Login
-    token = test_login()
-    results.append(("Login", token is not None))
+            # Tests 4, 6 and 7 only need the token
+            incidents_response, traversal, status_no_auth, status_auth = await asyncio.gather(
+                client.get("/api/incidents/", headers=headers),
+                # Try to access parent directory
+                client.get("/api/incidents/../../../etc/passwd", headers=headers),
+                client.get("/api/status/INC-2024-001"),
+                client.get("/api/status/INC-2024-001", headers=headers),
+                return_exceptions=True
+            )
 
-    if token:
-        # Test 4: Authenticated access
-        incidents = test_incidents_with_auth(token)
-        results.append(("Authenticated Access", len(incidents) > 0))
+            # Test 4: Authenticated access
+            incidents = check_incidents_with_auth(incidents_response)
+            results.append(("Authenticated Access", len(incidents) > 0))
 
-        # Test 5: Incident detail
-        if incidents:
-            incident_id = incidents[0].get("incident_id", "INC-2024-001")
-            results.append(("Incident Detail", test_incident_detail_with_auth(token, incident_id)))
+            # Test 5: Incident detail (needs an ID from test 4)
+            if incidents:
+                incident_id = incidents[0].get("incident_id", "INC-2024-001")
+                try:
+                    detail = await client.get(f"/api/incidents/{incident_id}", headers=headers)
+                except httpx.HTTPError as e:
+                    detail = e
+                results.append(("Incident Detail", check_incident_detail_with_auth(detail, incident_id)))
 
-        # Test 6: Path traversal protection
-        results.append(("Path Traversal Block", test_path_traversal(token)))
+            # Test 6: Path traversal protection
+            results.append(("Path Traversal Block", check_path_traversal(traversal)))
 
-        # Test 7: Status endpoint auth
-        results.append(("Status Endpoint Auth", test_status_endpoint_auth(token)))
+            # Test 7: Status endpoint auth
+            results.append(("Status Endpoint Auth", check_status_endpoint_auth(status_no_auth, status_auth)))
 
     # Summary
     print("\n" + "=" * 60)
@@ -223,4 +233,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))